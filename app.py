@@ -1,18 +1,38 @@
 from datetime import datetime
+from functools import lru_cache, wraps
+from zoneinfo import ZoneInfo
 import signal
 import sys
 import json
+import hashlib
 import logging
+import time
+import threading
+import queue
 import csv
 import io
 import re
-from flask import Flask, render_template, request, jsonify, make_response
+from flask import Flask, render_template, request, jsonify, make_response, Response, g, redirect, abort
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 from twilio.twiml.messaging_response import MessagingResponse
+from twilio.request_validator import RequestValidator
 
 from config import Config
-from database import init_db, get_session, Message, MessageTemplate, ManualContact, ContactNote
-from twilio_service import twilio_service
+from database import init_db, get_session, get_db_session, engine, Message, MessageTemplate, ManualContact, ContactNote
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import select, text, func, delete
+from twilio_service import twilio_service, BULK_SEND_WORKERS
 from scheduler import message_scheduler
 from leads_service import (
     get_leads_stats, 
@@ -38,34 +58,92 @@ from auth import (
     role_required
 )
 from campaign_service import campaign_service
+from cache import cache_get, cache_set, cache_delete, cache_incr
 
 logger = logging.getLogger(__name__)
 
+# Short TTLs for dashboard-polled endpoints (seconds)
+STATS_CACHE_TTL = 20
+CONVERSATIONS_CACHE_TTL = 30
+CAMPAIGNS_CACHE_TTL = 30
+# Filter options come from permits-table aggregations that change ~daily
+FILTER_OPTIONS_CACHE_TTL = 900
+# Max sends to the same number per window on /api/messages/send
+SEND_RATE_LIMIT_PER_NUMBER = 5
+SEND_RATE_LIMIT_WINDOW = 60
+
 
 # ============ Template Variable Processing ============
 
-def fill_template_variables(template: str, contact: dict) -> str:
+# Hoisted out of fill_template_variables - it runs once per recipient in
+# bulk sends, so no per-call regex compilation or zoneinfo lookup
+_MULTISPACE_RE = re.compile(r' +')
+_EASTERN_TZ = ZoneInfo('America/New_York')
+# Single-pass substitution over the known tokens; anything else in braces
+# is left untouched, same as the old replace chain
+_TOKEN_RE = re.compile(r'\{(name|company|role|phone|date|time)\}')
+# Tokens that require a contact lookup to render
+_CONTACT_VARS = {'name', 'company', 'role', 'phone'}
+
+
+@lru_cache(maxsize=256)
+def _template_segments(template: str):
+    """Split a template into (is_var, text) segments once per distinct
+    body. Bulk and recurring sends reuse the parse across recipients, so
+    per-recipient rendering is a plain join with no regex scan."""
+    segments = []
+    last = 0
+    for m in _TOKEN_RE.finditer(template):
+        if m.start() > last:
+            segments.append((False, template[last:m.start()]))
+        segments.append((True, m.group(1)))
+        last = m.end()
+    if last < len(template):
+        segments.append((False, template[last:]))
+    return tuple(segments)
+
+
+@lru_cache(maxsize=8)
+def _date_time_strings(now_eastern: datetime):
+    """Format {date}/{time} once per distinct timestamp - bulk sends pass
+    the same `now` for every recipient, so the whole batch hits the cache."""
+    return now_eastern.strftime('%m/%d/%Y'), now_eastern.strftime('%I:%M %p')
+
+
+def fill_template_variables(template: str, contact: dict, now: datetime = None) -> str:
     """Fill template variables with contact data"""
-    from zoneinfo import ZoneInfo
-    
-    result = template
-    
-    # Contact-based variables
-    result = result.replace('{name}', contact.get('name') or '')
-    result = result.replace('{company}', contact.get('company') or '')
-    result = result.replace('{role}', contact.get('role') or '')
-    result = result.replace('{phone}', contact.get('phone_normalized') or contact.get('phone') or '')
-    
-    # Date/time variables (Eastern Time)
-    eastern = ZoneInfo('America/New_York')
-    now_eastern = datetime.now(eastern)
-    result = result.replace('{date}', now_eastern.strftime('%m/%d/%Y'))
-    result = result.replace('{time}', now_eastern.strftime('%I:%M %p'))
-    
-    # Clean up any empty variable results (double spaces)
-    result = re.sub(r' +', ' ', result).strip()
-    
-    return result
+    if '{' not in template:
+        return template
+
+    values = {
+        'name': contact.get('name') or '',
+        'company': contact.get('company') or '',
+        'role': contact.get('role') or '',
+        'phone': contact.get('phone_normalized') or contact.get('phone') or '',
+    }
+
+    # Date/time variables (Eastern Time) - only fetch the clock when the
+    # template actually uses them; bulk callers pass one shared `now`
+    if '{date}' in template or '{time}' in template:
+        values['date'], values['time'] = _date_time_strings(now or datetime.now(_EASTERN_TZ))
+
+    had_empty = False
+    parts = []
+    for is_var, text_part in _template_segments(template):
+        if is_var:
+            value = values.get(text_part, '')
+            if not value:
+                had_empty = True
+            parts.append(value)
+        else:
+            parts.append(text_part)
+    result = ''.join(parts)
+
+    # Clean up double spaces, but only when a variable actually came back
+    # empty - otherwise there's nothing to collapse
+    if had_empty:
+        result = _MULTISPACE_RE.sub(' ', result)
+    return result.strip()
 
 
 # Validate configuration on startup
@@ -76,21 +154,106 @@ if not Config.validate():
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(Config)
+# Cap request bodies so a multi-MB POST can't tie up a worker thread in
+# JSON parsing. 2MB leaves headroom for the contacts CSV upload.
+app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024
+# Match /path and /path/ directly instead of issuing a 308 redirect the
+# client has to round-trip
+app.url_map.strict_slashes = False
 CORS(app)
 
-# Initialize database
-init_db()
 
-# Initialize auth tables and create admin if needed
-try:
-    init_auth_tables()
-    create_admin_if_needed()
-except Exception as e:
-    logger.warning(f"Auth initialization warning: {e}")
+@app.errorhandler(400)
+def bad_request(e):
+    # Keep abort(400, ...) paths (e.g. _page_args) on the JSON envelope
+    # instead of werkzeug's HTML error page
+    return jsonify({'success': False, 'error': e.description or 'Bad request'}), 400
+
+
+@app.errorhandler(413)
+def payload_too_large(e):
+    return jsonify({'success': False, 'error': 'Payload too large'}), 413
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """orjson-backed serialization for every jsonify call site - ~2-5x
+    faster than stdlib json on the larger contact/message payloads."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+# Gzip/Brotli the JSON endpoints - contact/conversation payloads compress
+# 5-10x, which dominates dashboard load time on slow uplinks
+if Compress is not None:
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
+
+# Database/auth initialization is deferred to the first request so gunicorn
+# workers bind immediately instead of serializing on schema checks at boot
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def _ensure_initialized():
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+
+        # Initialize database
+        init_db()
+
+        # Initialize auth tables and create admin if needed
+        try:
+            init_auth_tables()
+            create_admin_if_needed()
+        except Exception as e:
+            logger.warning(f"Auth initialization warning: {e}")
+
+        _initialized = True
+
+
+@app.before_request
+def _lazy_init():
+    _ensure_initialized()
 
 
 # ============ Graceful Shutdown ============
 
+# In-flight request counter so SIGTERM can drain before exiting. Railway
+# rolls deploys with SIGTERM; exiting mid-request aborts webhook DB writes
+# and leaks their pooled connections.
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+# Bounded drain - Railway force-kills ~30s after SIGTERM, stay under that
+SHUTDOWN_DRAIN_SECONDS = 25
+
+
+@app.before_request
+def _track_request_start():
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight += 1
+
+
+@app.teardown_request
+def _track_request_end(exc=None):
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight -= 1
+
+
 def graceful_shutdown(signum, frame):
     """Handle graceful shutdown on SIGTERM"""
     logger.info("Received shutdown signal, cleaning up...")
@@ -99,6 +262,16 @@ def graceful_shutdown(signum, frame):
         logger.info("Scheduler shut down successfully")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
+
+    # Let in-flight requests and queued webhook jobs finish (bounded)
+    # so their DB writes commit
+    deadline = time.monotonic() + SHUTDOWN_DRAIN_SECONDS
+    while (_in_flight > 0 or not _webhook_queue.empty()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    if _in_flight > 0:
+        logger.warning(f"Shutting down with {_in_flight} request(s) still in flight")
+
+    engine.dispose()
     sys.exit(0)
 
 # Register signal handlers for graceful shutdown
@@ -108,26 +281,37 @@ signal.signal(signal.SIGINT, graceful_shutdown)
 
 # ============ Health Check ============
 
+# Railway polls /health every few seconds; only probe the DB when the last
+# result (healthy or not) is older than this so probes don't steal pool
+# connections - and a down DB isn't hammered by every probe either
+HEALTH_PROBE_TTL = 5
+_health_cache = {'ts': 0.0, 'ok': False, 'err': None}
+
+
 @app.route('/health')
 def health_check():
     """Health check endpoint for Railway/monitoring"""
-    try:
-        # Check database connection
-        session = get_session()
-        session.execute("SELECT 1")
-        session.close()
-        
+    if time.monotonic() - _health_cache['ts'] >= HEALTH_PROBE_TTL:
+        # A bare pooled connection is enough here; no ORM session or
+        # transaction setup for a monitoring ping
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("SELECT 1")
+            _health_cache.update(ts=time.monotonic(), ok=True, err=None)
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            _health_cache.update(ts=time.monotonic(), ok=False, err=str(e))
+
+    if _health_cache['ok']:
         return jsonify({
             'status': 'healthy',
             'timestamp': datetime.utcnow().isoformat(),
             'service': 'sms-dashboard'
         })
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return jsonify({
-            'status': 'unhealthy',
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'status': 'unhealthy',
+        'error': _health_cache['err']
+    }), 500
 
 
 # ============ Authentication Routes ============
@@ -218,7 +402,6 @@ def get_users():
 @role_required('admin')
 def create_new_user():
     """Create a new user (admin only)"""
-    from flask import g
     data = request.json
     
     required = ['email', 'password', 'name']
@@ -251,7 +434,6 @@ def update_existing_user(user_id):
 @role_required('admin')
 def delete_existing_user(user_id):
     """Delete a user (admin only)"""
-    from flask import g
     if user_id == g.current_user['id']:
         return jsonify({'success': False, 'error': 'Cannot delete yourself'}), 400
     result = delete_user(user_id)
@@ -268,21 +450,59 @@ def get_available_roles():
 
 # ============ Frontend Routes ============
 
+# index.html takes no template context, so render it once and serve the
+# cached bytes with an ETag instead of re-running Jinja per request
+_INDEX_HTML = None
+_INDEX_ETAG = None
+
+
 @app.route('/')
 def dashboard():
     """Serve the main dashboard"""
-    return render_template('index.html')
+    global _INDEX_HTML, _INDEX_ETAG
+    if _INDEX_HTML is None:
+        _INDEX_HTML = render_template('index.html').encode('utf-8')
+        _INDEX_ETAG = hashlib.md5(_INDEX_HTML).hexdigest()
+
+    response = Response(_INDEX_HTML, mimetype='text/html')
+    response.set_etag(_INDEX_ETAG)
+    return response.make_conditional(request)
 
 
 # ============ API Routes - Messages ============
 
+def _page_args(default=100, cap=500):
+    """
+    Parse limit/offset query args, clamped so a single request can't ask
+    the DB to materialize millions of rows. Non-integers get a 400.
+    """
+    try:
+        limit = int(request.args.get('limit', default))
+        offset = int(request.args.get('offset', 0))
+    except (TypeError, ValueError):
+        abort(400, description='limit and offset must be integers')
+    return min(max(limit, 1), cap), max(offset, 0)
+
+
 @app.route('/api/messages', methods=['GET'])
 def get_messages():
-    """Get message history"""
+    """Get message history, streamed so peak memory stays flat at any limit"""
     phone = request.args.get('phone')
-    limit = request.args.get('limit', 100, type=int)
-    messages = twilio_service.get_message_history(phone, limit)
-    return jsonify({'success': True, 'messages': messages})
+    limit, _ = _page_args()
+
+    dumps = (lambda o: orjson.dumps(o).decode('utf-8')) if orjson else json.dumps
+
+    def generate():
+        yield '{"success": true, "messages": ['
+        first = True
+        for m in twilio_service.iter_message_history(phone, limit):
+            if not first:
+                yield ','
+            first = False
+            yield dumps(m)
+        yield ']}'
+
+    return Response(generate(), mimetype='application/json')
 
 
 @app.route('/api/messages/send', methods=['POST'])
@@ -294,11 +514,17 @@ def send_message():
     
     if not to_number or not body:
         return jsonify({'success': False, 'error': 'Missing required fields'}), 400
-    
-    # Check if body contains template variables
-    if '{' in body and '}' in body:
+
+    # Cheap counter guard so a looping frontend can't burn Twilio round-trips
+    # on the same number - one cache op vs a ~300ms rejected HTTPS call
+    rl_key = f'rl:send:{normalize_phone(to_number) or to_number}'
+    if cache_incr(rl_key, SEND_RATE_LIMIT_WINDOW) > SEND_RATE_LIMIT_PER_NUMBER:
+        return jsonify({'success': False, 'error': 'Rate limit exceeded for this number, try again shortly'}), 429
+
+    # Only braces that are actual known tokens trigger the contact lookup;
+    # literal braces in a message body go straight through
+    if _TOKEN_RE.search(body):
         # Get contact info for variable replacement
-        normalized = normalize_phone_number(to_number)
         contacts_list = get_contacts_by_phones([to_number])
         contact = {}
         if contacts_list:
@@ -308,6 +534,7 @@ def send_message():
         body = fill_template_variables(body, contact)
     
     result = twilio_service.send_sms(to_number, body)
+    cache_delete('conv:list', f'conv:{normalize_phone(to_number) or to_number}')
     return jsonify(result)
 
 
@@ -324,34 +551,45 @@ def send_bulk_messages():
     if not phone_numbers:
         return jsonify({'success': False, 'error': 'No recipients specified'}), 400
     
-    # Check if body contains template variables
-    has_variables = '{' in body and '}' in body
-    
-    if has_variables:
-        # Get contact info for variable replacement
+    # Which variables does the body actually use? Only contact-based ones
+    # force the per-recipient contact lookup and personalization path.
+    needed_vars = set(_TOKEN_RE.findall(body))
+
+    if needed_vars & _CONTACT_VARS:
+        # Get contact info for variable replacement. Normalizing both the
+        # map keys and the recipients once means a single dict lookup per
+        # recipient instead of a normalized-then-raw fallback probe.
         contacts_list = get_contacts_by_phones(phone_numbers)
-        contacts_map = {c.get('phone_normalized') or c.get('phone'): c for c in contacts_list}
-        
-        results = {'sent': 0, 'failed': 0, 'messages': []}
-        
+        contacts_map = {}
+        for c in contacts_list:
+            key = c.get('phone_normalized') or c.get('phone')
+            contacts_map.setdefault(normalize_phone_number(key) or key, c)
+
+        # Personalize up front, then fan the sends out like send_bulk_sms
+        # does - each Twilio call is an HTTPS round-trip, so a serial loop
+        # over 50 recipients took tens of seconds wall-clock
+        jobs = []
+        now = datetime.now(_EASTERN_TZ)
         for phone in phone_numbers:
-            normalized = normalize_phone_number(phone)
-            # Try normalized first, then raw phone as fallback
-            contact = contacts_map.get(normalized, contacts_map.get(phone, {}))
-            
-            # Fill template variables
-            personalized_body = fill_template_variables(body, contact)
-            
-            result = twilio_service.send_sms(phone, personalized_body)
-            if result['success']:
-                results['sent'] += 1
-            else:
-                results['failed'] += 1
-            results['messages'].append(result)
-        
+            contact = contacts_map.get(normalize_phone_number(phone) or phone, {})
+            jobs.append((phone, fill_template_variables(body, contact, now=now)))
+
+        results = {'sent': 0, 'failed': 0, 'messages': []}
+        with ThreadPoolExecutor(max_workers=min(BULK_SEND_WORKERS, len(jobs))) as executor:
+            # executor.map preserves input order in the response
+            for result in executor.map(lambda j: twilio_service.send_sms(*j), jobs):
+                if result['success']:
+                    results['sent'] += 1
+                else:
+                    results['failed'] += 1
+                results['messages'].append(result)
+
         return jsonify({'success': True, **results})
     else:
-        # No variables, use simple bulk send
+        # Only {date}/{time} (or no variables): render once, then the
+        # simple bulk send - no contact lookup needed
+        if needed_vars:
+            body = fill_template_variables(body, {})
         result = twilio_service.send_bulk_sms(phone_numbers, body)
         return jsonify({'success': True, **result})
 
@@ -360,16 +598,29 @@ def send_bulk_messages():
 
 @app.route('/api/conversations', methods=['GET'])
 def get_conversations():
-    """Get all conversations"""
+    """Get all conversations (cached; invalidated by webhook/send writes)"""
+    cached = cache_get('conv:list')
+    if cached:
+        return jsonify(cached)
+
     conversations = twilio_service.get_conversations()
-    return jsonify({'success': True, 'conversations': conversations})
+    payload = {'success': True, 'conversations': conversations}
+    cache_set('conv:list', payload, CONVERSATIONS_CACHE_TTL)
+    return jsonify(payload)
 
 
 @app.route('/api/conversations/<phone>', methods=['GET'])
 def get_conversation(phone):
     """Get messages for a specific conversation"""
+    key = f'conv:{normalize_phone(phone) or phone}'
+    cached = cache_get(key)
+    if cached:
+        return jsonify(cached)
+
     messages = twilio_service.get_conversation_messages(phone)
-    return jsonify({'success': True, 'messages': messages})
+    payload = {'success': True, 'messages': messages}
+    cache_set(key, payload, CONVERSATIONS_CACHE_TTL)
+    return jsonify(payload)
 
 
 # ============ API Routes - Contacts (Live from Leads DB) ============
@@ -382,8 +633,10 @@ def get_contacts():
     search = request.args.get('search', '')
     mobile_only = request.args.get('mobile_only', 'true').lower() == 'true'
     source = request.args.get('source', 'all')  # 'permit', 'owner', or 'all'
-    limit = request.args.get('limit', 100, type=int)
-    offset = request.args.get('offset', 0, type=int)
+    limit, offset = _page_args()
+    # Keyset cursor (preferred over offset for deep pages): the raw phone of
+    # the last row from the previous page, echoed back as next_cursor
+    after = request.args.get('after', '')
     borough = request.args.get('borough', '')  # MANHATTAN, BROOKLYN, etc.
     role = request.args.get('role', '')  # Owner, Permittee
     
@@ -396,7 +649,16 @@ def get_contacts():
     permit_status = request.args.get('permit_status', '')
     bldg_type = request.args.get('bldg_type', '')
     residential = request.args.get('residential', '')
-    
+
+    # The keyset cursor orders by c.phone in the permit query only; owner
+    # rows are offset-paged and manual rows aren't paged at all, so a
+    # cursor over the merged 'all' stream would repeat/skip rows forever.
+    if after and source != 'permit':
+        return jsonify({
+            'success': False,
+            'error': "Cursor pagination (after) requires source=permit; use offset for other sources"
+        }), 400
+
     try:
         # Get leads database contacts
         contacts = get_all_contacts(
@@ -414,98 +676,148 @@ def get_contacts():
             permit_type=permit_type if permit_type else None,
             permit_status=permit_status if permit_status else None,
             bldg_type=bldg_type if bldg_type else None,
-            residential=residential if residential else None
+            residential=residential if residential else None,
+            after=after if after else None
         )
         
-        # Format leads contacts for frontend
-        result = []
-        seen_phones = set()
+        # Format leads contacts for frontend. Every row carries 'id',
+        # 'name' and 'phone_normalized', so index those directly and keep
+        # .get() only for the source-dependent permit fields.
+        result = [{
+            'id': c['id'],
+            'phone_number': c['phone_normalized'],
+            'name': c['name'],
+            'company': c.get('company'),
+            'permit_number': c.get('permit_no'),
+            'address': c.get('address'),
+            'role': c.get('role'),
+            'source': c.get('source', c.get('contact_source')),
+            'is_mobile': c.get('is_mobile', True),
+            'borough': c.get('borough'),
+            'neighborhood': c.get('neighborhood'),
+            'zip_code': c.get('zip_code'),
+            'job_type': c.get('job_type'),
+            'work_type': c.get('work_type'),
+            'permit_type': c.get('permit_type'),
+            'permit_status': c.get('permit_status'),
+            'bldg_type': c.get('bldg_type'),
+            'residential': c.get('residential')
+        } for c in contacts]
+        seen_phones = {c['phone_normalized'] for c in contacts if c['phone_normalized']}
         
-        for c in contacts:
-            phone = c.get('phone_normalized')
-            if phone:
-                seen_phones.add(phone)
-            result.append({
-                'id': c.get('id'),
-                'phone_number': phone,
-                'name': c.get('name'),
-                'company': c.get('company'),
-                'permit_number': c.get('permit_no'),
-                'address': c.get('address'),
-                'role': c.get('role'),
-                'source': c.get('source', c.get('contact_source')),
-                'is_mobile': c.get('is_mobile', True),
-                'borough': c.get('borough'),
-                'neighborhood': c.get('neighborhood'),
-                'zip_code': c.get('zip_code'),
-                'job_type': c.get('job_type'),
-                'work_type': c.get('work_type'),
-                'permit_type': c.get('permit_type'),
-                'permit_status': c.get('permit_status'),
-                'bldg_type': c.get('bldg_type'),
-                'residential': c.get('residential')
-            })
-        
-        # Also include manual contacts (filter by search if provided)
-        session = get_session()
-        try:
-            manual_query = session.query(ManualContact)
-            if search:
-                search_term = f'%{search}%'
-                manual_query = manual_query.filter(
-                    (ManualContact.name.ilike(search_term)) |
-                    (ManualContact.phone_number.ilike(search_term)) |
-                    (ManualContact.company.ilike(search_term))
+        # Also include manual contacts (filter by search if provided) -
+        # but not on cursor pages: manual rows aren't keyset-paged, so
+        # they'd repeat on every page after the first.
+        if not after:
+            session = get_session()
+            try:
+                manual_query = session.query(
+                    ManualContact.id,
+                    ManualContact.phone_number,
+                    ManualContact.name,
+                    ManualContact.company,
+                    ManualContact.role
                 )
-            if role:
-                manual_query = manual_query.filter(ManualContact.role == role)
-            
-            manual_contacts = manual_query.all()
-            
-            for mc in manual_contacts:
-                # Skip if already in leads results (dedupe by phone)
-                if mc.phone_number in seen_phones:
-                    continue
-                seen_phones.add(mc.phone_number)
-                result.append({
-                    'id': f'manual_{mc.id}',
-                    'phone_number': mc.phone_number,
-                    'name': mc.name,
-                    'company': mc.company,
-                    'permit_number': None,
-                    'address': None,
-                    'role': mc.role,
-                    'source': 'manual',
-                    'is_mobile': True,  # Assume manual contacts are mobile
-                    'borough': None
-                })
-        finally:
-            session.close()
-        
-        total = get_total_contact_count(
-            mobile_only=mobile_only, 
-            source=source,
-            borough=borough if borough else None,
-            role=role if role else None
-        )
-        # Add manual contacts to total
-        total += len([r for r in result if r.get('source') == 'manual'])
+                if search:
+                    search_term = f'%{search}%'
+                    manual_query = manual_query.filter(
+                        (ManualContact.name.ilike(search_term)) |
+                        (ManualContact.phone_number.ilike(search_term)) |
+                        (ManualContact.company.ilike(search_term))
+                    )
+                if role:
+                    manual_query = manual_query.filter(ManualContact.role == role)
+                if seen_phones:
+                    # Skip phones already in the leads results
+                    manual_query = manual_query.filter(
+                        ~ManualContact.phone_number.in_(list(seen_phones))
+                    )
+
+                for mc in manual_query:
+                    result.append({
+                        'id': f'manual_{mc.id}',
+                        'phone_number': mc.phone_number,
+                        'name': mc.name,
+                        'company': mc.company,
+                        'permit_number': None,
+                        'address': None,
+                        'role': mc.role,
+                        'source': 'manual',
+                        'is_mobile': True,  # Assume manual contacts are mobile
+                        'borough': None
+                    })
+            finally:
+                session.close()
         
+        # Total is a full COUNT scan on the leads DB - only compute it for
+        # the first page (cursor pages just need rows + next_cursor; clients
+        # needing a fresh count can hit /api/contacts/count)
+        total = None
+        if not after:
+            total = _get_cached_contact_total(mobile_only, source, borough, role)
+            # Add manual contacts to total
+            total += len([r for r in result if r.get('source') == 'manual'])
+
+        # Cursor for the next keyset page: last raw phone of the permit
+        # rows only - they're the one stream ordered by c.phone. None once
+        # the permit stream comes back empty, so clients terminate.
+        next_cursor = None
+        for c in reversed(contacts):
+            if c.get('source') == 'permit_contact' and c.get('phone'):
+                next_cursor = c['phone']
+                break
+
         return jsonify({
-            'success': True, 
+            'success': True,
             'contacts': result,
             'total': total,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': next_cursor
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _get_cached_contact_total(mobile_only, source, borough, role):
+    """Briefly cached COUNT against the leads DB (it's a full table scan)."""
+    total_key = f'contacts:total:{mobile_only}:{source}:{borough}:{role}'
+    total = cache_get(total_key)
+    if total is None:
+        total = get_total_contact_count(
+            mobile_only=mobile_only,
+            source=source,
+            borough=borough if borough else None,
+            role=role if role else None
+        )
+        cache_set(total_key, total, 60)
+    return total
+
+
+@app.route('/api/contacts/count', methods=['GET'])
+def get_contacts_count():
+    """Get the total contact count for the current filters (off the page hot path)"""
+    mobile_only = request.args.get('mobile_only', 'true').lower() == 'true'
+    source = request.args.get('source', 'all')
+    borough = request.args.get('borough', '')
+    role = request.args.get('role', '')
+    try:
+        total = _get_cached_contact_total(mobile_only, source, borough, role)
+        return jsonify({'success': True, 'total': total})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/contacts/filter-options', methods=['GET'])
 def get_contact_filter_options():
     """Get available filter options for contacts (neighborhoods, zip codes)"""
     try:
+        # Two permits-table GROUP BY scans that change at most daily -
+        # cache the payload well past the short stats TTL
+        cached = cache_get('filter:options')
+        if cached:
+            return jsonify(cached)
+
         from leads_service import get_leads_engine
         engine = get_leads_engine()
         
@@ -532,33 +844,64 @@ def get_contact_filter_options():
             """))
             zip_codes = [{'value': r.value, 'label': f"{r.value} ({r.cnt:,})"} for r in zips_result]
         
-        return jsonify({
+        payload = {
             'success': True,
             'neighborhoods': neighborhoods,
             'zip_codes': zip_codes
-        })
+        }
+        cache_set('filter:options', payload, FILTER_OPTIONS_CACHE_TTL)
+        return jsonify(payload)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/admin/cache/purge', methods=['POST'])
+@login_required
+@role_required('admin')
+def purge_cache():
+    """Drop the cached aggregate payloads (e.g. after a permits reload)"""
+    cache_delete('filter:options', 'stats:leads', 'stats:dashboard', 'conv:list',
+                 *(f'campaigns:list:{s}' for s in ('all', 'draft', 'active', 'paused', 'completed')))
+    return jsonify({'success': True})
+
+
 @app.route('/api/contacts/stats', methods=['GET'])
 def get_contacts_stats():
     """Get stats about available contacts in the leads database"""
     try:
-        stats = get_leads_stats()
-        return jsonify({'success': True, 'stats': stats})
+        cached = cache_get('stats:leads')
+        if cached:
+            return jsonify(cached)
+
+        payload = {'success': True, 'stats': get_leads_stats()}
+        cache_set('stats:leads', payload, STATS_CACHE_TTL)
+        return jsonify(payload)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 # ============ API Routes - Manual Contacts ============
 
+# Hoisted for normalize_phone_number - it runs per CSV row and per bulk
+# recipient. ASCII inputs take the C-level translate path; the compiled
+# regex only handles the rare non-ASCII string.
+_NONDIGIT_RE = re.compile(r'\D')
+_KEEP_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+
+@lru_cache(maxsize=10000)
 def normalize_phone_number(phone):
     """Normalize phone number to E.164 format"""
     if not phone:
         return None
+    # Fast path: already E.164
+    if phone.startswith('+') and phone[1:].isdigit() and 11 <= len(phone) <= 16:
+        return phone
     # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    if phone.isascii():
+        digits = phone.translate(_KEEP_DIGITS)
+    else:
+        digits = _NONDIGIT_RE.sub('', phone)
     # Handle US numbers
     if len(digits) == 10:
         return f'+1{digits}'
@@ -571,14 +914,45 @@ def normalize_phone_number(phone):
 
 @app.route('/api/contacts/manual', methods=['GET'])
 def get_manual_contacts():
-    """Get all manually added contacts"""
+    """Get manually added contacts (paginated)"""
+    limit, offset = _page_args()
+
     session = get_session()
     try:
-        contacts = session.query(ManualContact).order_by(ManualContact.name).all()
+        total = session.execute(select(func.count(ManualContact.id))).scalar()
+
+        # Column select instead of full ORM rows - no identity map or
+        # instance construction per contact, just driver tuples
+        rows = session.execute(
+            select(
+                ManualContact.id,
+                ManualContact.name,
+                ManualContact.phone_number,
+                ManualContact.company,
+                ManualContact.role,
+                ManualContact.notes,
+                ManualContact.created_at
+            ).order_by(ManualContact.name).limit(limit).offset(offset)
+        ).all()
+        contacts = [{
+            'id': r.id,
+            'name': r.name,
+            'phone': r.phone_number,
+            'phone_number': r.phone_number,
+            'phone_normalized': r.phone_number,  # Already normalized in E.164 format
+            'company': r.company,
+            'role': r.role,
+            'notes': r.notes,
+            'source': 'manual',
+            'created_at': r.created_at.isoformat() if r.created_at else None
+        } for r in rows]
         return jsonify({
             'success': True,
-            'contacts': [c.to_dict() for c in contacts],
-            'total': len(contacts)
+            'contacts': contacts,
+            'total': total,
+            'limit': limit,
+            'offset': offset,
+            'has_more': offset + len(contacts) < total
         })
     finally:
         session.close()
@@ -675,6 +1049,16 @@ def delete_manual_contact(contact_id):
         session.close()
 
 
+# Accepted CSV header spellings, lowercased with spaces -> underscores
+_CSV_HEADER_ALIASES = {
+    'phone': 'phone', 'phone_number': 'phone', 'mobile': 'phone',
+    'name': 'name', 'contact_name': 'name',
+    'company': 'company', 'business': 'company',
+    'role': 'role', 'title': 'role',
+    'notes': 'notes', 'comments': 'notes',
+}
+
+
 @app.route('/api/contacts/manual/upload', methods=['POST'])
 def upload_contacts_csv():
     """
@@ -686,58 +1070,102 @@ def upload_contacts_csv():
         csv_data = request.form.get('csv_data') or request.json.get('csv_data') if request.is_json else None
         if not csv_data:
             return jsonify({'success': False, 'error': 'No file or CSV data provided'}), 400
-        file_content = csv_data
+        csv_stream = io.StringIO(csv_data)
     else:
         file = request.files['file']
         if file.filename == '':
             return jsonify({'success': False, 'error': 'No file selected'}), 400
-        file_content = file.read().decode('utf-8')
-    
+        # Decode rows straight off the upload stream instead of buffering
+        # the whole file twice (bytes + decoded str)
+        csv_stream = io.TextIOWrapper(file.stream, encoding='utf-8', newline='')
+
     session = get_session()
     try:
-        reader = csv.DictReader(io.StringIO(file_content))
-        
-        added = 0
+        # Plain csv.reader with resolved column indices - DictReader builds
+        # a fresh dict per row, which is pure allocation churn here
+        reader = csv.reader(csv_stream)
+        try:
+            header = next(reader)
+        except StopIteration:
+            header = []
+
+        col = {}
+        for idx, name in enumerate(header):
+            canonical = _CSV_HEADER_ALIASES.get(name.strip().lower().replace(' ', '_'))
+            if canonical and canonical not in col:
+                col[canonical] = idx
+        phone_col = col.get('phone')
+        name_col = col.get('name')
+        company_col = col.get('company')
+        role_col = col.get('role')
+        notes_col = col.get('notes')
+
+        def _field(row, idx):
+            return row[idx] if idx is not None and idx < len(row) else None
+
         skipped = 0
         errors = []
-        
+        # normalized phone -> row fields; first occurrence wins, so this
+        # also dedupes within the file
+        candidates = {}
+
         for i, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-            # Find phone column (flexible naming)
-            phone = row.get('phone') or row.get('Phone') or row.get('phone_number') or row.get('Phone Number') or row.get('mobile') or row.get('Mobile')
-            
+            phone = _field(row, phone_col)
+
             if not phone:
                 errors.append(f'Row {i}: Missing phone number')
                 skipped += 1
                 continue
-            
+
             normalized = normalize_phone_number(phone)
             if not normalized:
                 errors.append(f'Row {i}: Invalid phone number "{phone}"')
                 skipped += 1
                 continue
-            
-            # Check for duplicate
-            existing = session.query(ManualContact).filter_by(phone_number=normalized).first()
-            if existing:
+
+            if normalized in candidates:
                 skipped += 1
                 continue
-            
-            # Get other fields (flexible naming)
-            name = row.get('name') or row.get('Name') or row.get('contact_name') or row.get('Contact Name')
-            company = row.get('company') or row.get('Company') or row.get('business') or row.get('Business')
-            role = row.get('role') or row.get('Role') or row.get('title') or row.get('Title')
-            notes = row.get('notes') or row.get('Notes') or row.get('comments') or row.get('Comments')
-            
-            contact = ManualContact(
-                phone_number=normalized,
-                name=name,
-                company=company,
-                role=role,
-                notes=notes
-            )
-            session.add(contact)
-            added += 1
-        
+
+            candidates[normalized] = {
+                'phone_number': normalized,
+                'name': _field(row, name_col),
+                'company': _field(row, company_col),
+                'role': _field(row, role_col),
+                'notes': _field(row, notes_col)
+            }
+
+        # Duplicate check in chunked IN (...) queries and one bulk INSERT
+        # instead of a SELECT plus session.add per row
+        added = 0
+        if candidates:
+            phones = list(candidates)
+            existing = set()
+            for start in range(0, len(phones), 1000):
+                chunk = phones[start:start + 1000]
+                existing.update(
+                    p for (p,) in session.query(ManualContact.phone_number).filter(
+                        ManualContact.phone_number.in_(chunk)
+                    )
+                )
+
+            to_insert = [c for p, c in candidates.items() if p not in existing]
+            skipped += len(candidates) - len(to_insert)
+            if to_insert:
+                # ON CONFLICT DO NOTHING (PG and SQLite both support it)
+                # lets the unique index absorb races with concurrent
+                # uploads instead of failing the whole batch
+                if engine.dialect.name == 'postgresql':
+                    from sqlalchemy.dialects.postgresql import insert as _insert
+                    stmt = _insert(ManualContact.__table__).on_conflict_do_nothing(index_elements=['phone_number'])
+                elif engine.dialect.name == 'sqlite':
+                    from sqlalchemy.dialects.sqlite import insert as _insert
+                    stmt = _insert(ManualContact.__table__).on_conflict_do_nothing(index_elements=['phone_number'])
+                else:
+                    stmt = ManualContact.__table__.insert()
+                session.execute(stmt, to_insert)
+            added = len(to_insert)
+
         session.commit()
         
         return jsonify({
@@ -836,22 +1264,32 @@ def schedule_message():
     # SAFETY: REQUIRE phone_numbers - never allow empty
     if not phone_numbers or len(phone_numbers) == 0:
         return jsonify({'success': False, 'error': 'SAFETY: You must select specific recipients. Cannot schedule without phone_numbers.'}), 400
-    
+
+    # Normalize to E.164 and dedupe once here (order-preserving) so the
+    # scheduler never sends twice to the same number from a pasted list
+    phone_numbers = list(dict.fromkeys(
+        n for n in (normalize_phone_number(p) for p in phone_numbers) if n
+    ))
+    if not phone_numbers:
+        return jsonify({'success': False, 'error': 'No valid phone numbers provided'}), 400
+
     # SAFETY: Cap at 50 recipients
     if len(phone_numbers) > 50:
         return jsonify({'success': False, 'error': f'SAFETY: Too many recipients ({len(phone_numbers)}). Maximum is 50 per scheduled message.'}), 400
     
+    # fromisoformat on Python 3.11+ accepts the trailing 'Z' directly,
+    # so no per-call str.replace; catch only the parse failure
     try:
-        scheduled_dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-    except:
+        scheduled_dt = datetime.fromisoformat(scheduled_at)
+    except (ValueError, TypeError):
         return jsonify({'success': False, 'error': 'Invalid date format'}), 400
-    
+
     # Parse recurrence end date if provided
     recurrence_end_dt = None
     if is_recurring and recurrence_end_date:
         try:
-            recurrence_end_dt = datetime.fromisoformat(recurrence_end_date.replace('Z', '+00:00'))
-        except:
+            recurrence_end_dt = datetime.fromisoformat(recurrence_end_date)
+        except (ValueError, TypeError):
             return jsonify({'success': False, 'error': 'Invalid recurrence end date format'}), 400
     
     try:
@@ -899,80 +1337,168 @@ def resume_scheduled(message_id):
 
 # ============ API Routes - Templates ============
 
+# Templates rarely change - keep the serialized response keyed by a table
+# version so repeat hits skip ORM materialization entirely
+_template_cache = {'ver': None, 'body': None}
+
+
 @app.route('/api/templates', methods=['GET'])
 def get_templates():
     """Get all message templates"""
-    session = get_session()
-    templates = session.query(MessageTemplate).order_by(MessageTemplate.name).all()
-    result = [t.to_dict() for t in templates]
-    session.close()
-    return jsonify({'success': True, 'templates': result})
+    with get_db_session() as session:
+        # (max updated_at, row count) changes on any create/update/delete,
+        # so a matching version means the cached blob is still current
+        max_updated, count = session.query(
+            func.max(MessageTemplate.updated_at), func.count(MessageTemplate.id)
+        ).one()
+        ver = (str(max_updated), count)
+
+        if _template_cache['ver'] == ver and _template_cache['body'] is not None:
+            return Response(_template_cache['body'], mimetype='application/json')
+
+        # Cache miss: rebuild from column tuples, skipping ORM instances
+        rows = session.execute(
+            select(
+                MessageTemplate.id, MessageTemplate.name, MessageTemplate.body,
+                MessageTemplate.created_at, MessageTemplate.updated_at
+            ).order_by(MessageTemplate.name)
+        ).all()
+        result = [{
+            'id': r.id,
+            'name': r.name,
+            'body': r.body,
+            'created_at': r.created_at.isoformat() if r.created_at else None,
+            'updated_at': r.updated_at.isoformat() if r.updated_at else None
+        } for r in rows]
+
+    body = app.json.dumps({'success': True, 'templates': result})
+    _template_cache['ver'] = ver
+    _template_cache['body'] = body
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/api/templates', methods=['POST'])
 def create_template():
     """Create a new template"""
     data = request.json
-    session = get_session()
-    
-    template = MessageTemplate(
-        name=data.get('name'),
-        body=data.get('body')
-    )
-    
-    session.add(template)
-    session.commit()
-    result = template.to_dict()
-    session.close()
+    with get_db_session() as session:
+        template = MessageTemplate(
+            name=data.get('name'),
+            body=data.get('body')
+        )
+        session.add(template)
+        session.flush()
+        result = template.to_dict()
     return jsonify({'success': True, 'template': result})
 
 
 @app.route('/api/templates/<int:template_id>', methods=['DELETE'])
 def delete_template(template_id):
     """Delete a template"""
-    session = get_session()
-    template = session.query(MessageTemplate).get(template_id)
-    
-    if not template:
-        session.close()
-        return jsonify({'success': False, 'error': 'Template not found'}), 404
-    
-    session.delete(template)
-    session.commit()
-    session.close()
+    # Single DELETE on the pk - no point loading the full row just to
+    # hand it back to session.delete()
+    with get_db_session() as session:
+        result = session.execute(
+            delete(MessageTemplate).where(MessageTemplate.id == template_id)
+        )
+        if result.rowcount == 0:
+            return jsonify({'success': False, 'error': 'Template not found'}), 404
     return jsonify({'success': True})
 
 
 # ============ Twilio Webhooks ============
 
-@app.route('/api/webhook/incoming', methods=['POST'])
-def incoming_message():
-    """Handle incoming SMS from Twilio"""
-    from_number = request.form.get('From')
-    body = request.form.get('Body')
-    twilio_sid = request.form.get('MessageSid')
-    
-    # Store the incoming message
+# The no-auto-reply TwiML never changes - serialize it once at import
+# instead of building a MessagingResponse per inbound SMS
+_EMPTY_TWIML = str(MessagingResponse())
+
+# Webhook work happens off-request: Twilio retries slow responses, so the
+# handlers just enqueue and ack while a daemon thread does the DB writes
+_webhook_queue = queue.Queue()
+
+
+def _process_inbound(from_number, body, twilio_sid):
     twilio_service.process_incoming_message(from_number, body, twilio_sid)
-    
+    cache_delete('stats:dashboard', 'conv:list',
+                 f'conv:{normalize_phone(from_number) or from_number}')
+
     # Track response in campaigns
     try:
         campaign_service.record_response(from_number, body)
     except Exception as e:
         logger.error(f"Error recording campaign response: {e}")
-    
+
+
+def _process_status(twilio_sid, status):
+    twilio_service.update_message_status(twilio_sid, status)
+    cache_delete('stats:dashboard', 'conv:list')
+
+
+def _webhook_worker():
+    while True:
+        handler, args = _webhook_queue.get()
+        try:
+            handler(*args)
+        except Exception as e:
+            logger.error(f"Error processing webhook job: {e}")
+        finally:
+            _webhook_queue.task_done()
+
+
+threading.Thread(target=_webhook_worker, daemon=True, name='webhook-worker').start()
+
+
+_twilio_validator = RequestValidator(Config.TWILIO_AUTH_TOKEN) if Config.TWILIO_AUTH_TOKEN else None
+
+
+def validate_twilio_signature(f):
+    """
+    Reject webhook POSTs that don't carry a valid Twilio HMAC signature
+    before anything is queued or written - forged requests cost one hash,
+    not a DB round-trip. Skipped when no auth token is configured (local
+    dev without Twilio credentials).
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if _twilio_validator is not None:
+            # Railway terminates TLS upstream, so rebuild the public URL
+            # Twilio actually signed
+            url = request.url
+            proto = request.headers.get('X-Forwarded-Proto')
+            if proto == 'https' and url.startswith('http://'):
+                url = 'https://' + url[len('http://'):]
+            signature = request.headers.get('X-Twilio-Signature', '')
+            if not _twilio_validator.validate(url, request.form, signature):
+                logger.warning(f"Rejected webhook with invalid Twilio signature from {request.remote_addr}")
+                return jsonify({'success': False, 'error': 'Invalid signature'}), 403
+        return f(*args, **kwargs)
+    return decorated
+
+
+@app.route('/api/webhook/incoming', methods=['POST'])
+@validate_twilio_signature
+def incoming_message():
+    """Handle incoming SMS from Twilio"""
+    from_number = request.form.get('From')
+    body = request.form.get('Body')
+    twilio_sid = request.form.get('MessageSid')
+
+    # Store off-request so Twilio gets its 200 immediately and doesn't
+    # retry (and duplicate) deliveries when the DB is slow
+    _webhook_queue.put((_process_inbound, (from_number, body, twilio_sid)))
+
     # Return empty TwiML response (no auto-reply)
-    response = MessagingResponse()
-    return str(response)
+    return _EMPTY_TWIML, 200, {'Content-Type': 'application/xml'}
 
 
 @app.route('/api/webhook/status', methods=['POST'])
+@validate_twilio_signature
 def message_status():
     """Handle message status callbacks from Twilio"""
     twilio_sid = request.form.get('MessageSid')
     status = request.form.get('MessageStatus')
-    
-    twilio_service.update_message_status(twilio_sid, status)
+
+    _webhook_queue.put((_process_status, (twilio_sid, status)))
     return '', 200
 
 
@@ -981,27 +1507,28 @@ def message_status():
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get dashboard statistics"""
-    session = get_session()
-    
+    cached = cache_get('stats:dashboard')
+    if cached:
+        return jsonify(cached)
+
     # Get contact count from leads DB
     try:
         leads_stats = get_leads_stats()
         total_contacts = leads_stats['mobile_contacts']  # Mobile contacts
     except:
         total_contacts = 0
-    
-    # Get message counts from local DB
-    total_messages = session.query(Message).count()
-    sent_messages = session.query(Message).filter(
-        Message.direction == 'outbound'
-    ).count()
-    received_messages = session.query(Message).filter(
-        Message.direction == 'inbound'
-    ).count()
-    
-    session.close()
-    
-    return jsonify({
+
+    # Get message counts from local DB in a single GROUP BY query
+    with get_db_session() as session:
+        counts = dict(
+            session.query(Message.direction, func.count(Message.id))
+            .group_by(Message.direction).all()
+        )
+    sent_messages = counts.get('outbound', 0)
+    received_messages = counts.get('inbound', 0)
+    total_messages = sum(counts.values())
+
+    payload = {
         'success': True,
         'stats': {
             'total_contacts': total_contacts,
@@ -1009,17 +1536,34 @@ def get_stats():
             'sent_messages': sent_messages,
             'received_messages': received_messages
         }
-    })
+    }
+    cache_set('stats:dashboard', payload, STATS_CACHE_TTL)
+    return jsonify(payload)
 
 
 # ============ Campaign API Endpoints ============
 
+def _purge_campaign_list_cache():
+    """Drop every cached campaign-list variant after a campaign mutation"""
+    for s in ('all', 'draft', 'active', 'paused', 'completed'):
+        cache_delete(f'campaigns:list:{s}')
+
+
 @app.route('/api/campaigns', methods=['GET'])
 @login_required
 def list_campaigns():
     """List all campaigns"""
     status = request.args.get('status')
+
+    # Dashboard polls this list; the per-campaign stats aggregation is the
+    # expensive part, so serve repeats from cache between mutations
+    cache_key = f'campaigns:list:{status or "all"}'
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return jsonify({'success': True, 'campaigns': cached})
+
     campaigns = campaign_service.list_campaigns(status=status, include_stats=True)
+    cache_set(cache_key, campaigns, ttl=CAMPAIGNS_CACHE_TTL)
     return jsonify({'success': True, 'campaigns': campaigns})
 
 
@@ -1043,6 +1587,7 @@ def create_campaign():
         created_by=user.get('id') if user else None
     )
     
+    _purge_campaign_list_cache()
     return jsonify({'success': True, 'campaign': campaign})
 
 
@@ -1069,6 +1614,7 @@ def update_campaign(campaign_id):
     if not campaign:
         return jsonify({'success': False, 'error': 'Campaign not found'}), 404
     
+    _purge_campaign_list_cache()
     return jsonify({'success': True, 'campaign': campaign})
 
 
@@ -1080,6 +1626,7 @@ def delete_campaign(campaign_id):
         success = campaign_service.delete_campaign(campaign_id)
         if not success:
             return jsonify({'success': False, 'error': 'Campaign not found'}), 404
+        _purge_campaign_list_cache()
         return jsonify({'success': True})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1122,6 +1669,7 @@ def add_campaign_message(campaign_id):
     if not message:
         return jsonify({'success': False, 'error': 'Campaign not found'}), 404
     
+    _purge_campaign_list_cache()
     return jsonify({'success': True, 'message': message})
 
 
@@ -1147,6 +1695,7 @@ def delete_campaign_message(message_id):
         success = campaign_service.delete_message(message_id)
         if not success:
             return jsonify({'success': False, 'error': 'Message not found'}), 404
+        _purge_campaign_list_cache()
         return jsonify({'success': True})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1251,6 +1800,7 @@ def enroll_contacts(campaign_id):
             manual_contacts=data.get('manual_contacts')
         )
         
+        _purge_campaign_list_cache()
         return jsonify({'success': True, 'enrolled_count': count})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1261,22 +1811,24 @@ def enroll_contacts(campaign_id):
 def get_campaign_enrollments(campaign_id):
     """Get campaign enrollments"""
     status = request.args.get('status')
-    limit = int(request.args.get('limit', 100))
-    offset = int(request.args.get('offset', 0))
-    
-    enrollments, total = campaign_service.get_enrollments(
+    limit, offset = _page_args()
+    after_id = request.args.get('after_id', type=int)
+
+    enrollments, total, next_after_id = campaign_service.get_enrollments(
         campaign_id=campaign_id,
         status=status,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after_id=after_id
     )
-    
+
     return jsonify({
         'success': True,
         'enrollments': enrollments,
         'total': total,
         'limit': limit,
-        'offset': offset
+        'offset': offset,
+        'next_after_id': next_after_id
     })
 
 
@@ -1288,6 +1840,7 @@ def start_campaign(campaign_id):
     """Start a campaign"""
     try:
         campaign = campaign_service.start_campaign(campaign_id)
+        _purge_campaign_list_cache()
         return jsonify({'success': True, 'campaign': campaign})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1299,6 +1852,7 @@ def pause_campaign(campaign_id):
     """Pause a campaign"""
     try:
         campaign = campaign_service.pause_campaign(campaign_id)
+        _purge_campaign_list_cache()
         return jsonify({'success': True, 'campaign': campaign})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1310,6 +1864,7 @@ def resume_campaign(campaign_id):
     """Resume a paused campaign"""
     try:
         campaign = campaign_service.resume_campaign(campaign_id)
+        _purge_campaign_list_cache()
         return jsonify({'success': True, 'campaign': campaign})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1321,6 +1876,7 @@ def complete_campaign(campaign_id):
     """Mark a campaign as completed"""
     try:
         campaign = campaign_service.complete_campaign(campaign_id)
+        _purge_campaign_list_cache()
         return jsonify({'success': True, 'campaign': campaign})
     except ValueError as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -1497,7 +2053,6 @@ def list_email_campaigns():
 @app.route('/api/email/campaigns', methods=['POST'])
 @login_required
 def create_email_campaign():
-    from flask import g
     data = request.json or {}
     if not data.get('name'):
         return jsonify({'success': False, 'error': 'name required'}), 400
@@ -1607,7 +2162,6 @@ def sync_email_messages(campaign_id):
 @login_required
 def duplicate_email_campaign(campaign_id):
     """Clone a campaign's settings + sequence into a new draft."""
-    from flask import g
     created_by = getattr(g, 'current_user', {}).get('id') if hasattr(g, 'current_user') else None
     clone = email_campaign_service.duplicate_campaign(campaign_id, created_by=created_by)
     if not clone:
@@ -1628,12 +2182,11 @@ def enroll_email_contacts(campaign_id):
 
     if data.get('use_filters') or data.get('filter_criteria'):
         from leads_service import get_leads_engine
-        from sqlalchemy import text as _text
         try:
             engine = get_leads_engine()
             with engine.connect() as conn:
                 # Pull from owner_contacts.email
-                rows = conn.execute(_text("""
+                rows = conn.execute(text("""
                     SELECT owner_name AS name, email, phone, source
                     FROM owner_contacts
                     WHERE email IS NOT NULL AND email != ''
@@ -1664,8 +2217,7 @@ def enroll_email_contacts(campaign_id):
 @login_required
 def list_email_enrollments(campaign_id):
     status = request.args.get('status')
-    limit = request.args.get('limit', 100, type=int)
-    offset = request.args.get('offset', 0, type=int)
+    limit, offset = _page_args()
     enrollments, total = email_campaign_service.get_enrollments(campaign_id, status, limit, offset)
     return jsonify({'success': True, 'enrollments': enrollments, 'total': total})
 
@@ -1869,7 +2421,6 @@ def track_open(send_token):
 @app.route('/api/email/track/click/<send_token>', methods=['GET'])
 def track_click(send_token):
     """Click tracking redirect."""
-    from flask import redirect
     url = request.args.get('u', '/')
     try:
         send_id = int(send_token)
@@ -2024,7 +2575,6 @@ def email_dashboard_stats():
     """High-level email metrics for the dashboard."""
     session = get_session()
     try:
-        from sqlalchemy import func as _func
         total_campaigns = session.query(EmailCampaign).count()
         active_campaigns = session.query(EmailCampaign).filter(EmailCampaign.status == 'active').count()
         total_sends = session.query(EmailSend).filter(EmailSend.status == 'sent').count()
@@ -2079,5 +2629,7 @@ def not_found(error):
 
 
 if __name__ == '__main__':
+    # Dev only - production runs under gunicorn with gthread workers
+    # (see Procfile) so webhooks, health checks and dashboard calls overlap
     logger.info("Starting SMS Dashboard in development mode...")
     app.run(debug=Config.DEBUG, port=5000)
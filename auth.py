@@ -15,14 +15,52 @@ Roles and Permissions:
 - viewer: Read-only access
 """
 
+import atexit
 import os
 import hashlib
+import queue
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify, session, g
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+
+# Short-TTL cache for validated session tokens so every authenticated
+# request doesn't pay an auth-DB round-trip. The TTL bounds revocation
+# lag; logout and user mutations invalidate eagerly.
+SESSION_CACHE_TTL = 60
+_session_cache = {}  # (token, dashboard) -> (user_dict, cached_at)
+_session_cache_lock = threading.Lock()
+
+
+def _session_cache_get(token, dashboard):
+    with _session_cache_lock:
+        entry = _session_cache.get((token, dashboard))
+        if entry and time.monotonic() - entry[1] < SESSION_CACHE_TTL:
+            return entry[0]
+        if entry:
+            del _session_cache[(token, dashboard)]
+    return None
+
+
+def _session_cache_put(token, dashboard, user):
+    with _session_cache_lock:
+        _session_cache[(token, dashboard)] = (user, time.monotonic())
+
+
+def _session_cache_invalidate(token=None):
+    """Drop one token's entries, or everything when token is None."""
+    with _session_cache_lock:
+        if token is None:
+            _session_cache.clear()
+        else:
+            for key in [k for k in _session_cache if k[0] == token]:
+                del _session_cache[key]
 
 
 # Permission definitions for each dashboard feature
@@ -61,27 +99,76 @@ PERMISSIONS = {
     'settings.edit': ['admin'],
 }
 
+# Reverse index built once at import: role -> frozenset of permissions,
+# so permission checks are a hash lookup instead of a list scan of
+# PERMISSIONS per call. Admin implicitly holds everything.
+_ROLE_PERMISSIONS = {}
+for _perm, _roles in PERMISSIONS.items():
+    for _role in _roles:
+        _ROLE_PERMISSIONS.setdefault(_role, set()).add(_perm)
+_ROLE_PERMISSIONS['admin'] = set(PERMISSIONS)
+_ROLE_PERMISSIONS = {role: frozenset(perms) for role, perms in _ROLE_PERMISSIONS.items()}
+_NO_PERMISSIONS = frozenset()
+
+
+# validate_session runs on every authenticated request; connecting per
+# call pays TCP + TLS + auth each time, which dwarfs the query itself.
+# The pool is built lazily on first use so imports stay side-effect free.
+_auth_pool = None
+_auth_pool_lock = threading.Lock()
+
+
+class _PooledConnection:
+    """
+    Thin proxy whose close() returns the connection to the pool instead
+    of tearing it down, so the existing conn.close() call sites all keep
+    working unchanged. putconn rolls back any open transaction.
+    """
+    __slots__ = ('_conn', '_returned')
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._returned = False
+
+    def close(self):
+        if not self._returned:
+            self._returned = True
+            _auth_pool.putconn(self._conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
 
 def get_auth_db_connection():
-    """Get connection to the shared leads database for auth tables"""
-    from config import Config
-    
-    db_url = Config.LEADS_DATABASE_URL
-    if not db_url:
-        raise ValueError("LEADS_DATABASE_URL not configured")
-    
-    # Parse the URL if it's in postgresql:// format
-    if db_url.startswith('postgresql://') or db_url.startswith('postgres://'):
-        return psycopg2.connect(db_url, cursor_factory=RealDictCursor)
-    else:
-        return psycopg2.connect(
-            host=os.getenv('LEADS_DB_HOST'),
-            port=os.getenv('LEADS_DB_PORT', 5432),
-            database=os.getenv('LEADS_DB_NAME'),
-            user=os.getenv('LEADS_DB_USER'),
-            password=os.getenv('LEADS_DB_PASSWORD'),
-            cursor_factory=RealDictCursor
-        )
+    """Borrow a pooled connection to the shared leads database for auth tables"""
+    global _auth_pool
+
+    if _auth_pool is None:
+        with _auth_pool_lock:
+            if _auth_pool is None:
+                from config import Config
+
+                db_url = Config.LEADS_DATABASE_URL
+                if not db_url:
+                    raise ValueError("LEADS_DATABASE_URL not configured")
+
+                # Parse the URL if it's in postgresql:// format
+                if db_url.startswith('postgresql://') or db_url.startswith('postgres://'):
+                    _auth_pool = ThreadedConnectionPool(
+                        2, 20, db_url, cursor_factory=RealDictCursor
+                    )
+                else:
+                    _auth_pool = ThreadedConnectionPool(
+                        2, 20,
+                        host=os.getenv('LEADS_DB_HOST'),
+                        port=os.getenv('LEADS_DB_PORT', 5432),
+                        database=os.getenv('LEADS_DB_NAME'),
+                        user=os.getenv('LEADS_DB_USER'),
+                        password=os.getenv('LEADS_DB_PASSWORD'),
+                        cursor_factory=RealDictCursor
+                    )
+
+    return _PooledConnection(_auth_pool.getconn())
 
 
 def init_auth_tables():
@@ -140,6 +227,12 @@ def init_auth_tables():
             CREATE INDEX IF NOT EXISTS idx_auth_sessions_token ON auth_sessions(token);
             CREATE INDEX IF NOT EXISTS idx_auth_sessions_user ON auth_sessions(user_id);
             CREATE INDEX IF NOT EXISTS idx_auth_sessions_expires ON auth_sessions(expires_at);
+            -- Covering index for validate_session: token lookup can read
+            -- user_id/expires_at/dashboard straight from the index instead
+            -- of hitting the heap (a partial WHERE expires_at > now() isn't
+            -- possible - now() isn't immutable)
+            CREATE INDEX IF NOT EXISTS idx_auth_sessions_token_covering
+                ON auth_sessions(token) INCLUDE (user_id, expires_at, dashboard);
         """)
         
         # Roles table (for custom roles in the future)
@@ -207,24 +300,47 @@ def init_auth_tables():
         conn.close()
 
 
+PBKDF2_ITERATIONS = 100_000
+
+
 def hash_password(password, salt=None):
-    """Hash a password with salt using SHA-256"""
+    """
+    Hash a password with PBKDF2-HMAC-SHA256.
+
+    The whole iteration chain runs inside OpenSSL, so 100k rounds cost
+    less wall time than the old 10k-round pure-Python SHA-256 loop did.
+    The algorithm/iteration tag in the stored value keeps future
+    parameter bumps possible without a schema change.
+    """
     if salt is None:
         salt = secrets.token_hex(32)
-    
-    # Use PBKDF2-like iteration
+
+    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${dk.hex()}", salt
+
+
+def _legacy_hash_password(password, salt):
+    """Pre-PBKDF2 hash (10k chained SHA-256 rounds), kept for verifying
+    rows created before the format change"""
     combined = f"{salt}{password}".encode('utf-8')
     for _ in range(10000):
         combined = hashlib.sha256(combined).digest()
-    
-    password_hash = combined.hex()
-    return password_hash, salt
+    return combined.hex()
 
 
 def verify_password(password, password_hash, salt):
-    """Verify a password against its hash"""
-    computed_hash, _ = hash_password(password, salt)
-    return secrets.compare_digest(computed_hash, password_hash)
+    """Verify a password against its hash (tagged PBKDF2 or legacy)"""
+    if password_hash.startswith('pbkdf2_sha256$'):
+        try:
+            _, iterations, digest = password_hash.split('$', 2)
+            dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), int(iterations))
+        except ValueError:
+            return False
+        return secrets.compare_digest(dk.hex(), digest)
+
+    # Untagged rows predate the PBKDF2 switch; authenticate_user rehashes
+    # them on the next successful login
+    return secrets.compare_digest(_legacy_hash_password(password, salt), password_hash)
 
 
 def generate_session_token():
@@ -292,7 +408,16 @@ def authenticate_user(email, password, dashboard='sms'):
         # Check if user can access this dashboard
         if dashboard not in user['allowed_dashboards']:
             return {'success': False, 'error': f'No access to {dashboard} dashboard'}
-        
+
+        # One-shot upgrade of legacy-format hashes now that we have the
+        # plaintext in hand
+        if not user['password_hash'].startswith('pbkdf2_sha256$'):
+            new_hash, new_salt = hash_password(password)
+            cur.execute("""
+                UPDATE auth_users SET password_hash = %s, salt = %s, updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s;
+            """, (new_hash, new_salt, user['id']))
+
         # Create session token
         token = generate_session_token()
         expires_at = datetime.utcnow() + timedelta(days=7)
@@ -335,6 +460,10 @@ def authenticate_user(email, password, dashboard='sms'):
 
 def validate_session(token, dashboard='sms'):
     """Validate a session token and return user info"""
+    cached = _session_cache_get(token, dashboard)
+    if cached is not None:
+        return cached
+
     conn = get_auth_db_connection()
     cur = conn.cursor()
     
@@ -360,14 +489,16 @@ def validate_session(token, dashboard='sms'):
             UPDATE auth_sessions SET last_activity = CURRENT_TIMESTAMP WHERE id = %s;
         """, (result['session_id'],))
         conn.commit()
-        
-        return {
+
+        user = {
             'id': result['id'],
             'email': result['email'],
             'name': result['name'],
             'role': result['role'],
             'allowed_dashboards': result['allowed_dashboards']
         }
+        _session_cache_put(token, dashboard, user)
+        return user
         
     except Exception as e:
         print(f"Session validation error: {e}")
@@ -379,6 +510,7 @@ def validate_session(token, dashboard='sms'):
 
 def logout_user(token):
     """Invalidate a session token"""
+    _session_cache_invalidate(token)
     conn = get_auth_db_connection()
     cur = conn.cursor()
     
@@ -438,7 +570,10 @@ def update_user(user_id, **kwargs):
         
         user = cur.fetchone()
         conn.commit()
-        
+
+        # Cached sessions may carry stale role/active flags
+        _session_cache_invalidate()
+
         return {'success': True, 'user': dict(user)} if user else {'success': False, 'error': 'User not found'}
         
     except Exception as e:
@@ -463,7 +598,10 @@ def delete_user(user_id):
         deleted = cur.fetchone()
         
         conn.commit()
-        
+
+        # Their sessions are gone from the DB; drop any cached copies too
+        _session_cache_invalidate()
+
         if deleted:
             return {'success': True}
         else:
@@ -558,27 +696,16 @@ def has_permission(user, permission):
         return False
     
     role = user.get('role', 'viewer')
-    
-    # Admin has all permissions
-    if role == 'admin':
-        return True
-    
-    # Check against permission definitions
-    allowed_roles = PERMISSIONS.get(permission, [])
-    return role in allowed_roles
+    return permission in _ROLE_PERMISSIONS.get(role, _NO_PERMISSIONS)
 
 
 def get_user_permissions(user):
     """Get all permissions for a user"""
     if not user:
         return []
-    
+
     role = user.get('role', 'viewer')
-    
-    if role == 'admin':
-        return list(PERMISSIONS.keys())
-    
-    return [perm for perm, roles in PERMISSIONS.items() if role in roles]
+    return sorted(_ROLE_PERMISSIONS.get(role, _NO_PERMISSIONS))
 
 
 # ============ Flask Decorators ============
@@ -645,21 +772,32 @@ def role_required(*roles):
 
 # ============ Activity Logging ============
 
-def log_activity(user_id, action, resource_type=None, resource_id=None, details=None, dashboard='sms'):
-    """Log user activity"""
-    conn = get_auth_db_connection()
+# Activity rows are queued and batch-inserted off-request: one
+# execute_values INSERT per flush instead of a connection + single-row
+# INSERT + commit on the caller's critical path.
+_ACTIVITY_QUEUE_MAX = 10_000
+_ACTIVITY_BATCH_SIZE = 500
+_ACTIVITY_FLUSH_INTERVAL = 0.5  # seconds to wait for a batch to fill
+
+_activity_queue = queue.Queue(maxsize=_ACTIVITY_QUEUE_MAX)
+_activity_worker_started = False
+_activity_worker_lock = threading.Lock()
+
+
+def _flush_activity_rows(rows):
+    """Insert a batch of activity rows in one statement"""
+    try:
+        conn = get_auth_db_connection()
+    except Exception as e:
+        print(f"Error logging activity: {e}")
+        return
+
     cur = conn.cursor()
-    
     try:
-        ip_address = request.remote_addr if request else None
-        
-        cur.execute("""
+        execute_values(cur, """
             INSERT INTO auth_activity_log (user_id, action, resource_type, resource_id, details, ip_address, dashboard)
-            VALUES (%s, %s, %s, %s, %s, %s, %s);
-        """, (user_id, action, resource_type, resource_id, 
-              psycopg2.extras.Json(details) if details else None, 
-              ip_address, dashboard))
-        
+            VALUES %s;
+        """, rows, page_size=_ACTIVITY_BATCH_SIZE)
         conn.commit()
     except Exception as e:
         conn.rollback()
@@ -669,6 +807,64 @@ def log_activity(user_id, action, resource_type=None, resource_id=None, details=
         conn.close()
 
 
+def _activity_worker():
+    while True:
+        rows = [_activity_queue.get()]
+        # Gather what arrives within the flush window so bursts collapse
+        # into one INSERT
+        deadline = time.monotonic() + _ACTIVITY_FLUSH_INTERVAL
+        while len(rows) < _ACTIVITY_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_activity_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _flush_activity_rows(rows)
+        for _ in rows:
+            _activity_queue.task_done()
+
+
+def _ensure_activity_worker():
+    global _activity_worker_started
+    if _activity_worker_started:
+        return
+    with _activity_worker_lock:
+        if not _activity_worker_started:
+            threading.Thread(target=_activity_worker, daemon=True, name='activity-log-worker').start()
+            _activity_worker_started = True
+
+
+@atexit.register
+def _drain_activity_queue():
+    """Flush anything still queued when the process exits"""
+    rows = []
+    while True:
+        try:
+            rows.append(_activity_queue.get_nowait())
+        except queue.Empty:
+            break
+    if rows:
+        _flush_activity_rows(rows)
+
+
+def log_activity(user_id, action, resource_type=None, resource_id=None, details=None, dashboard='sms'):
+    """Queue an activity-log entry for background batch insert"""
+    # Capture request-bound fields now - the worker thread has no context
+    ip_address = request.remote_addr if request else None
+
+    _ensure_activity_worker()
+    try:
+        _activity_queue.put_nowait((
+            user_id, action, resource_type, resource_id,
+            psycopg2.extras.Json(details) if details else None,
+            ip_address, dashboard
+        ))
+    except queue.Full:
+        print("Activity log queue full; dropping entry")
+
+
 # ============ Bootstrap Admin User ============
 
 def create_admin_if_needed():
@@ -0,0 +1,125 @@
+"""
+Lightweight response cache for hot read endpoints.
+
+Uses Redis when REDIS_URL is configured (shared across gunicorn workers on
+Railway); otherwise falls back to a small in-process TTL dict so local dev
+works without a Redis instance. Values are JSON-serialized either way.
+"""
+import json
+import time
+import threading
+import logging
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+_redis_client = None
+_redis_failed = False
+
+# In-process fallback: key -> (expires_at, json_blob)
+_local_store = {}
+_local_lock = threading.Lock()
+
+
+def _get_redis():
+    """Lazily connect to Redis. Returns None if unconfigured or unavailable."""
+    global _redis_client, _redis_failed
+    if _redis_failed or not Config.REDIS_URL or redis is None:
+        return None
+    if _redis_client is None:
+        try:
+            _redis_client = redis.Redis.from_url(
+                Config.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+            _redis_client.ping()
+            logger.info("✓ Redis cache connected")
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using in-process cache: {e}")
+            _redis_failed = True
+            _redis_client = None
+    return _redis_client
+
+def cache_get(key):
+    """Get a cached value (deserialized), or None on miss/error."""
+    r = _get_redis()
+    if r is not None:
+        try:
+            blob = r.get(key)
+            return json.loads(blob) if blob else None
+        except Exception as e:
+            logger.warning(f"Redis GET failed for {key}: {e}")
+            return None
+    with _local_lock:
+        entry = _local_store.get(key)
+        if entry and entry[0] > time.monotonic():
+            return json.loads(entry[1])
+        if entry:
+            del _local_store[key]
+    return None
+
+
+def cache_set(key, value, ttl):
+    """Cache a JSON-serializable value for ttl seconds."""
+    blob = json.dumps(value)
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.setex(key, ttl, blob)
+            return
+        except Exception as e:
+            logger.warning(f"Redis SETEX failed for {key}: {e}")
+            return
+    with _local_lock:
+        _local_store[key] = (time.monotonic() + ttl, blob)
+
+
+def cache_incr(key, ttl):
+    """
+    Atomically increment a counter, setting its TTL on first increment.
+    Returns the new count. Used for cheap rate-limit windows.
+    """
+    r = _get_redis()
+    if r is not None:
+        try:
+            count = r.incr(key)
+            if count == 1:
+                r.expire(key, ttl)
+            return count
+        except Exception as e:
+            logger.warning(f"Redis INCR failed for {key}: {e}")
+            return 1
+    with _local_lock:
+        entry = _local_store.get(key)
+        if entry and entry[0] > time.monotonic():
+            count = json.loads(entry[1]) + 1
+            _local_store[key] = (entry[0], json.dumps(count))
+        else:
+            count = 1
+            _local_store[key] = (time.monotonic() + ttl, json.dumps(count))
+    return count
+
+
+def cache_delete(*keys):
+    """Invalidate one or more cache keys."""
+    if not keys:
+        return
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.delete(*keys)
+            return
+        except Exception as e:
+            logger.warning(f"Redis DELETE failed: {e}")
+            return
+    with _local_lock:
+        for key in keys:
+            _local_store.pop(key, None)
@@ -8,8 +8,8 @@ from typing import List, Dict, Optional, Tuple
 import json
 import random
 import logging
-from sqlalchemy import and_, or_, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, or_, func, insert, update
+from sqlalchemy.orm import joinedload, selectinload
 
 from database import (
     get_db_session, get_session,
@@ -17,7 +17,7 @@ from database import (
     CampaignEnrollment, CampaignSend,
     CampaignStatus, EnrollmentStatus
 )
-from leads_service import get_all_contacts, normalize_phone, get_contacts_by_phones
+from leads_service import get_all_contacts, count_filtered_contacts, normalize_phone, get_contacts_by_phones
 
 logger = logging.getLogger(__name__)
 
@@ -62,9 +62,14 @@ class CampaignService:
         """Get a campaign by ID with optional stats"""
         session = get_session()
         try:
+            # selectinload instead of joinedload: two joined collections
+            # multiply into messages x enrollments rows, and the per-message
+            # ab_test/sends used by to_dict(include_stats=True) would each
+            # fire their own lazy SELECT
             campaign = session.query(Campaign).options(
-                joinedload(Campaign.messages),
-                joinedload(Campaign.enrollments)
+                selectinload(Campaign.messages).selectinload(CampaignMessage.ab_test),
+                selectinload(Campaign.messages).selectinload(CampaignMessage.sends),
+                selectinload(Campaign.enrollments)
             ).filter(Campaign.id == campaign_id).first()
             
             if not campaign:
@@ -87,8 +92,8 @@ class CampaignService:
         session = get_session()
         try:
             query = session.query(Campaign).options(
-                joinedload(Campaign.messages),
-                joinedload(Campaign.enrollments)
+                selectinload(Campaign.messages),
+                selectinload(Campaign.enrollments)
             )
             
             if status:
@@ -306,18 +311,16 @@ class CampaignService:
     
     def preview_enrollment(self, filter_criteria: dict, limit: int = 50, offset: int = 0) -> Tuple[int, List[dict]]:
         """Preview contacts that would be enrolled based on filter criteria"""
-        # Get total count first
-        all_contacts = get_all_contacts(
+        # Count with an aggregate and fetch only the rows the preview shows,
+        # instead of materializing up to 10k contact dicts just to len() them
+        total_count = count_filtered_contacts(mobile_only=True, **filter_criteria)
+
+        sample = get_all_contacts(
             mobile_only=True,
-            limit=10000,  # Max for counting
+            limit=offset + limit,
             **filter_criteria
-        )
-        
-        total_count = len(all_contacts)
-        
-        # Get slice for display
-        sample = all_contacts[offset:offset + limit]
-        
+        )[offset:offset + limit]
+
         return total_count, sample
     
     def check_overlap(self, phone_numbers: List[str]) -> Dict[str, List[str]]:
@@ -325,20 +328,24 @@ class CampaignService:
         session = get_session()
         try:
             overlaps = {}
-            
-            active_enrollments = session.query(CampaignEnrollment, Campaign).join(
-                Campaign, CampaignEnrollment.campaign_id == Campaign.id
-            ).filter(
-                CampaignEnrollment.phone_number.in_(phone_numbers),
-                Campaign.status.in_([CampaignStatus.ACTIVE.value, CampaignStatus.PAUSED.value]),
-                CampaignEnrollment.status.in_([EnrollmentStatus.ACTIVE.value, EnrollmentStatus.ENGAGED.value])
-            ).all()
-            
-            for enrollment, campaign in active_enrollments:
-                if campaign.name not in overlaps:
-                    overlaps[campaign.name] = []
-                overlaps[campaign.name].append(enrollment.phone_number)
-            
+
+            # One IN query per 1000-number chunk - keeps bulk-select checks
+            # at a handful of round trips while staying under parameter limits
+            for i in range(0, len(phone_numbers), 1000):
+                chunk = phone_numbers[i:i + 1000]
+                active_enrollments = session.query(CampaignEnrollment, Campaign).join(
+                    Campaign, CampaignEnrollment.campaign_id == Campaign.id
+                ).filter(
+                    CampaignEnrollment.phone_number.in_(chunk),
+                    Campaign.status.in_([CampaignStatus.ACTIVE.value, CampaignStatus.PAUSED.value]),
+                    CampaignEnrollment.status.in_([EnrollmentStatus.ACTIVE.value, EnrollmentStatus.ENGAGED.value])
+                ).all()
+
+                for enrollment, campaign in active_enrollments:
+                    if campaign.name not in overlaps:
+                        overlaps[campaign.name] = []
+                    overlaps[campaign.name].append(enrollment.phone_number)
+
             return overlaps
         finally:
             session.close()
@@ -390,67 +397,91 @@ class CampaignService:
                 CampaignMessage.has_ab_test == True
             ).count() > 0
             
-            enrolled_count = 0
-            enrolled_phones = set()  # Track to avoid duplicates from filters + manual
-            
+            # Dedupe candidates in Python (filters + manual can overlap),
+            # keeping first occurrence like the old loop did
+            candidates = {}
             for contact in all_contacts:
                 phone = normalize_phone(contact.get('phone') or contact.get('phone_number') or contact.get('phone_normalized'))
-                
-                if not phone or phone in exclude_phones or phone in enrolled_phones:
-                    continue
-                
-                # Check if already enrolled
-                existing = session.query(CampaignEnrollment).filter(
-                    CampaignEnrollment.campaign_id == campaign_id,
-                    CampaignEnrollment.phone_number == phone
-                ).first()
-                
-                if existing:
+
+                if not phone or phone in exclude_phones or phone in candidates:
                     continue
-                
-                # Assign A/B variant randomly if campaign has A/B tests
-                ab_variant = random.choice(['A', 'B']) if has_ab_test else None
-                
-                enrollment = CampaignEnrollment(
-                    campaign_id=campaign_id,
-                    phone_number=phone,
-                    contact_name=contact.get('name'),
-                    contact_company=contact.get('company'),
-                    ab_variant=ab_variant,
-                    status=EnrollmentStatus.ACTIVE.value
+                candidates[phone] = contact
+
+            # One chunked IN query for already-enrolled phones instead of a
+            # SELECT per contact
+            existing_phones = set()
+            phones = list(candidates)
+            for i in range(0, len(phones), 1000):
+                chunk = phones[i:i + 1000]
+                existing_phones.update(
+                    p for (p,) in session.query(CampaignEnrollment.phone_number).filter(
+                        CampaignEnrollment.campaign_id == campaign_id,
+                        CampaignEnrollment.phone_number.in_(chunk)
+                    ).all()
                 )
-                session.add(enrollment)
-                enrolled_phones.add(phone)
-                enrolled_count += 1
-            
+
+            rows = [
+                {
+                    'campaign_id': campaign_id,
+                    'phone_number': phone,
+                    'contact_name': contact.get('name'),
+                    'contact_company': contact.get('company'),
+                    # Assign A/B variant randomly if campaign has A/B tests
+                    'ab_variant': random.choice(['A', 'B']) if has_ab_test else None,
+                    'status': EnrollmentStatus.ACTIVE.value
+                }
+                for phone, contact in candidates.items()
+                if phone not in existing_phones
+            ]
+
+            if rows:
+                # Core executemany: one batched INSERT instead of ORM
+                # unit-of-work bookkeeping per enrollment
+                session.execute(insert(CampaignEnrollment), rows)
             session.commit()
-            return enrolled_count
+            return len(rows)
         finally:
             session.close()
     
     def get_enrollments(
-        self, 
-        campaign_id: int, 
+        self,
+        campaign_id: int,
         status: str = None,
         limit: int = 100,
-        offset: int = 0
-    ) -> Tuple[List[dict], int]:
-        """Get campaign enrollments with optional status filter"""
+        offset: int = 0,
+        after_id: int = None
+    ) -> Tuple[List[dict], int, Optional[int]]:
+        """
+        Get campaign enrollments with optional status filter.
+
+        Pass after_id (the next_after_id from the previous page) for keyset
+        pagination - the DB seeks straight to the page instead of scanning
+        and discarding `offset` rows. offset remains as a fallback for
+        callers that don't send a cursor.
+        """
         session = get_session()
         try:
             query = session.query(CampaignEnrollment).filter(
                 CampaignEnrollment.campaign_id == campaign_id
             )
-            
+
             if status:
                 query = query.filter(CampaignEnrollment.status == status)
-            
+
             total = query.count()
-            enrollments = query.order_by(
-                CampaignEnrollment.enrolled_at.desc()
-            ).offset(offset).limit(limit).all()
-            
-            return [e.to_dict() for e in enrollments], total
+            # Order by id desc: ids track enrolled_at and give a unique,
+            # indexed keyset column
+            query = query.order_by(CampaignEnrollment.id.desc())
+            if after_id is not None:
+                query = query.filter(CampaignEnrollment.id < after_id)
+            elif offset:
+                query = query.offset(offset)
+
+            enrollments = query.limit(limit).yield_per(500)
+
+            result = [e.to_dict() for e in enrollments]
+            next_after_id = result[-1]['id'] if len(result) == limit else None
+            return result, total, next_after_id
         finally:
             session.close()
     
@@ -486,56 +517,70 @@ class CampaignService:
             
             return campaign.to_dict()
     
+    def _transition(self, session, campaign_id: int, new_status: str,
+                    allowed_from: List[str], error: str, extra_values: dict = None) -> 'Campaign':
+        """
+        Guarded atomic status change: the allowed source states live in the
+        UPDATE's WHERE clause, so two concurrent lifecycle calls can't both
+        win and there's no read-then-write race window.
+        """
+        values = {'status': new_status}
+        if extra_values:
+            values.update(extra_values)
+
+        result = session.execute(
+            update(Campaign).where(
+                Campaign.id == campaign_id,
+                Campaign.status.in_(allowed_from)
+            ).values(**values)
+        )
+
+        if result.rowcount == 0:
+            exists = session.query(Campaign.id).filter(Campaign.id == campaign_id).first()
+            raise ValueError(error if exists else "Campaign not found")
+
+        return session.query(Campaign).filter(Campaign.id == campaign_id).first()
+
     def pause_campaign(self, campaign_id: int) -> dict:
         """Pause an active campaign"""
         with get_db_session() as session:
-            campaign = session.query(Campaign).filter(Campaign.id == campaign_id).first()
-            
-            if not campaign:
-                raise ValueError("Campaign not found")
-            
-            if campaign.status != CampaignStatus.ACTIVE.value:
-                raise ValueError("Can only pause active campaigns")
-            
-            campaign.status = CampaignStatus.PAUSED.value
-            campaign.paused_at = datetime.utcnow()
-            
-            session.flush()
-            
+            campaign = self._transition(
+                session, campaign_id,
+                CampaignStatus.PAUSED.value,
+                [CampaignStatus.ACTIVE.value],
+                "Can only pause active campaigns",
+                {'paused_at': datetime.utcnow()}
+            )
             return campaign.to_dict()
-    
+
     def resume_campaign(self, campaign_id: int) -> dict:
         """Resume a paused campaign"""
         with get_db_session() as session:
-            campaign = session.query(Campaign).filter(Campaign.id == campaign_id).first()
-            
-            if not campaign:
-                raise ValueError("Campaign not found")
-            
-            if campaign.status != CampaignStatus.PAUSED.value:
-                raise ValueError("Can only resume paused campaigns")
-            
-            campaign.status = CampaignStatus.ACTIVE.value
-            campaign.paused_at = None
-            
-            session.flush()
-            
+            campaign = self._transition(
+                session, campaign_id,
+                CampaignStatus.ACTIVE.value,
+                [CampaignStatus.PAUSED.value],
+                "Can only resume paused campaigns",
+                {'paused_at': None}
+            )
             return campaign.to_dict()
     
     def complete_campaign(self, campaign_id: int) -> dict:
         """Mark a campaign as completed"""
         with get_db_session() as session:
-            campaign = session.query(Campaign).filter(Campaign.id == campaign_id).first()
-            
-            if not campaign:
-                raise ValueError("Campaign not found")
-            
-            campaign.status = CampaignStatus.COMPLETED.value
-            campaign.completed_at = datetime.utcnow()
-            
-            # Set response tracking window (30 days from now)
-            campaign.response_tracking_ends_at = datetime.utcnow() + timedelta(days=30)
-            
+            now = datetime.utcnow()
+            campaign = self._transition(
+                session, campaign_id,
+                CampaignStatus.COMPLETED.value,
+                [CampaignStatus.DRAFT.value, CampaignStatus.ACTIVE.value, CampaignStatus.PAUSED.value],
+                "Campaign is already completed",
+                {
+                    'completed_at': now,
+                    # Response tracking window: 30 days from completion
+                    'response_tracking_ends_at': now + timedelta(days=30)
+                }
+            )
+
             # Mark all active enrollments as completed
             session.query(CampaignEnrollment).filter(
                 CampaignEnrollment.campaign_id == campaign_id,
@@ -631,8 +676,8 @@ class CampaignService:
         session = get_session()
         try:
             campaign = session.query(Campaign).options(
-                joinedload(Campaign.messages).joinedload(CampaignMessage.sends),
-                joinedload(Campaign.enrollments)
+                selectinload(Campaign.messages).selectinload(CampaignMessage.sends),
+                selectinload(Campaign.enrollments)
             ).filter(Campaign.id == campaign_id).first()
             
             if not campaign:
@@ -24,6 +24,17 @@ class Config:
     
     # External Leads Database (Railway PostgreSQL - for live contact queries)
     LEADS_DATABASE_URL = os.getenv('LEADS_DATABASE_URL')
+
+    # SQLAlchemy pool sizing for the dashboard DB (PostgreSQL only).
+    # Defaults match the values tuned for Railway; override per environment.
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '30'))
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+
+    # Redis (optional) - response caching shared across workers.
+    # Falls back to an in-process cache when unset (see cache.py).
+    REDIS_URL = os.getenv('REDIS_URL')
     
     # Flask
     SECRET_KEY = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key')
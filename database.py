@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.pool import QueuePool
@@ -21,13 +21,29 @@ engine_args = {
 if Config.DATABASE_URL and Config.DATABASE_URL.startswith('postgresql'):
     engine_args.update({
         'poolclass': QueuePool,
-        'pool_size': 5,
-        'max_overflow': 10,
-        'pool_recycle': 300,  # Recycle connections every 5 minutes
+        'pool_size': Config.DB_POOL_SIZE,
+        'max_overflow': Config.DB_MAX_OVERFLOW,
+        'pool_timeout': Config.DB_POOL_TIMEOUT,  # Max seconds to wait for a free connection
+        'pool_recycle': Config.DB_POOL_RECYCLE,  # Recycle stale connections (default 30 min)
+        'pool_use_lifo': True,  # Reuse hot connections so idle overflow ages out
     })
 
 engine = create_engine(Config.DATABASE_URL, **engine_args)
-Session = sessionmaker(bind=engine)
+
+if engine.dialect.name == 'sqlite':
+    # Local/dev runs on SQLite: WAL lets dashboard reads proceed during
+    # webhook writes, and synchronous=NORMAL batches fsyncs (safe in WAL
+    # mode - a crash loses at most the last transactions, not integrity)
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+# expire_on_commit=False keeps loaded attributes readable after commit,
+# so to_dict() calls don't trigger a re-SELECT per object.
+Session = sessionmaker(bind=engine, expire_on_commit=False)
 Base = declarative_base()
 
 
@@ -66,7 +82,13 @@ class Message(Base):
     sent_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     error_message = Column(Text, nullable=True)
-    
+
+    # Stats and per-direction listings filter on direction and order/range
+    # on created_at; the composite keeps those index-only as the table grows
+    __table_args__ = (
+        Index('ix_messages_direction_created_at', 'direction', 'created_at'),
+    )
+
     def to_dict(self, contact=None):
         """Convert to dict. Contact info is fetched separately from leads DB."""
         return {
@@ -1068,6 +1090,18 @@ def _run_migrations():
             except Exception as e:
                 logger.warning(f"Migration for {table}.{column}: {e}")
 
+        # create_all skips existing tables, so indexes added after first
+        # deploy need an explicit statement (IF NOT EXISTS works on both
+        # PostgreSQL and SQLite)
+        try:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_messages_direction_created_at "
+                "ON messages (direction, created_at)"
+            ))
+            conn.commit()
+        except Exception as e:
+            logger.warning(f"Migration for messages index: {e}")
+
 
 def get_session():
     """Get a new database session"""
@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for Railway.
+
+gthread workers: every hot route is I/O-bound (Twilio HTTPS calls, leads
+DB queries), and threads release the GIL while blocked, so requests
+overlap without monkey-patching. gevent was considered and rejected -
+psycopg2 uses blocking C sockets, so greenlets would serialize on the DB
+anyway without psycogreen.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', (os.cpu_count() or 2) + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = 60
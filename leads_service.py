@@ -7,6 +7,7 @@ from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import OperationalError
 import logging
 import time
+from functools import lru_cache
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -79,10 +80,11 @@ def get_leads_stats():
         }
 
 
-def search_contacts(search: str = None, mobile_only: bool = True, limit: int = 100, offset: int = 0, 
+def search_contacts(search: str = None, mobile_only: bool = True, limit: int = 100, offset: int = 0,
                     borough: str = None, role: str = None, neighborhood: str = None, zip_code: str = None,
-                    job_type: str = None, work_type: str = None, permit_type: str = None, 
-                    permit_status: str = None, bldg_type: str = None, residential: str = None):
+                    job_type: str = None, work_type: str = None, permit_type: str = None,
+                    permit_status: str = None, bldg_type: str = None, residential: str = None,
+                    after: str = None):
     """
     Search contacts from the leads database.
     Combines permit contacts and owner contacts.
@@ -171,7 +173,14 @@ def search_contacts(search: str = None, mobile_only: bool = True, limit: int = 1
     if residential:
         query += " AND p.residential = :residential"
         params['residential'] = residential
-    
+
+    # Keyset pagination: rows come back ordered by c.phone, so seeking past
+    # the last phone of the previous page is O(limit) instead of O(offset+limit)
+    if after:
+        query += " AND c.phone > :after"
+        params['after'] = after
+        offset = 0
+
     query += " ORDER BY c.phone, c.updated_at DESC"
     query += f" LIMIT {limit} OFFSET {offset}"
     
@@ -299,7 +308,7 @@ def get_all_contacts(search: str = None, mobile_only: bool = True, source: str =
                      borough: str = None, role: str = None, neighborhood: str = None, zip_code: str = None,
                      job_type: str = None, work_type: str = None, permit_type: str = None,
                      permit_status: str = None, bldg_type: str = None, residential: str = None,
-                     filing_status: str = None, zip: str = None, **kwargs):
+                     filing_status: str = None, zip: str = None, after: str = None, **kwargs):
     """
     Get contacts from permit contacts, owner contacts, AND manual contacts.
     
@@ -368,7 +377,7 @@ def get_all_contacts(search: str = None, mobile_only: bool = True, source: str =
         permit_contacts = search_contacts(
             search, mobile_only, limit, offset, borough, role,
             neighborhood, zip_code, job_type, work_type, permit_type,
-            permit_status, bldg_type, residential
+            permit_status, bldg_type, residential, after
         )
         contacts.extend(permit_contacts)
     
@@ -414,25 +423,28 @@ def get_contacts_by_phones(phones: list):
         except:
             normalized_phones.append(phone)
     
-    # Check manual contacts first (local DB)
+    # Check manual contacts first (local DB), chunked to stay within
+    # driver parameter limits for large phone lists
     session = get_session()
     try:
-        manual_contacts = session.query(ManualContact).filter(
-            ManualContact.phone_number.in_(normalized_phones)
-        ).all()
-        
-        for mc in manual_contacts:
-            results.append(mc.to_dict())
-            found_phones.add(mc.phone_number)
+        for start in range(0, len(normalized_phones), 1000):
+            chunk = normalized_phones[start:start + 1000]
+            manual_contacts = session.query(ManualContact).filter(
+                ManualContact.phone_number.in_(chunk)
+            ).all()
+
+            for mc in manual_contacts:
+                results.append(mc.to_dict())
+                found_phones.add(mc.phone_number)
     finally:
         session.close()
-    
+
     # Then check leads database for remaining phones
     remaining_phones = [p for p in phones if normalize_phone(p) not in found_phones]
-    
+
     if remaining_phones:
         engine = get_leads_engine()
-        
+
         # Normalize phones for comparison
         normalized = []
         for phone in remaining_phones:
@@ -440,11 +452,11 @@ def get_contacts_by_phones(phones: list):
             if len(digits) == 11 and digits.startswith('1'):
                 digits = digits[1:]
             normalized.append(digits)
-        
-        placeholders = ','.join([f"'{p}'" for p in normalized])
-        
-        query = f"""
-            SELECT 
+
+        # Bound parameters (psycopg2 adapts the list to a PG array) instead
+        # of interpolating phone strings into the SQL
+        query = """
+            SELECT
                 c.id,
                 c.name,
                 c.phone,
@@ -457,13 +469,15 @@ def get_contacts_by_phones(phones: list):
             FROM contacts c
             LEFT JOIN permit_contacts pc ON c.id = pc.contact_id
             LEFT JOIN permits p ON pc.permit_id = p.id
-            WHERE c.phone IN ({placeholders})
+            WHERE c.phone = ANY(:phones)
         """
-        
+
+        contacts = []
         with engine.connect() as conn:
-            result = conn.execute(text(query))
-            contacts = [dict(row._mapping) for row in result]
-            
+            for start in range(0, len(normalized), 1000):
+                result = conn.execute(text(query), {'phones': normalized[start:start + 1000]})
+                contacts.extend(dict(row._mapping) for row in result)
+
             for c in contacts:
                 c['phone_normalized'] = normalize_phone(c['phone'])
             
@@ -472,38 +486,152 @@ def get_contacts_by_phones(phones: list):
     return results
 
 
+def count_filtered_contacts(search: str = None, mobile_only: bool = True, source: str = 'all',
+                            borough: str = None, role: str = None, neighborhood: str = None,
+                            zip_code: str = None, job_type: str = None, work_type: str = None,
+                            permit_type: str = None, permit_status: str = None, bldg_type: str = None,
+                            residential: str = None, filing_status: str = None, zip: str = None,
+                            **kwargs):
+    """
+    Count contacts matching the same filters as get_all_contacts, without
+    materializing any rows. Permit and owner aggregates run as one
+    statement (same pattern as get_total_contact_count). Cross-source
+    duplicates are deduped at fetch time, not here, so the count is an
+    upper bound - same caveat as the old fetch-and-len approach, which
+    was additionally capped at 10k rows.
+    """
+    # Handle aliases (same as get_all_contacts)
+    if filing_status and not permit_status:
+        permit_status = filing_status
+    if zip and not zip_code:
+        zip_code = zip
+
+    total = 0
+    params = {}
+
+    permit_query = """
+        SELECT COUNT(DISTINCT c.phone)
+        FROM contacts c
+        LEFT JOIN permit_contacts pc ON c.id = pc.contact_id
+        LEFT JOIN permits p ON pc.permit_id = p.id
+        WHERE c.phone IS NOT NULL AND c.phone != ''
+    """
+    if mobile_only:
+        permit_query += " AND c.is_mobile = true"
+    if search:
+        permit_query += """ AND (
+            c.name ILIKE :search
+            OR c.phone ILIKE :search
+            OR p.owner_business_name ILIKE :search
+            OR p.address ILIKE :search
+        )"""
+        params['search'] = f'%{search}%'
+    if borough:
+        permit_query += " AND p.borough = :borough"
+        params['borough'] = borough
+    if role:
+        permit_query += " AND c.role = :role"
+        params['role'] = role
+    if neighborhood:
+        permit_query += " AND p.nta_name = :neighborhood"
+        params['neighborhood'] = neighborhood
+    if zip_code:
+        permit_query += " AND p.zip_code = :zip_code"
+        params['zip_code'] = zip_code
+    if job_type:
+        permit_query += " AND p.job_type = :job_type"
+        params['job_type'] = job_type
+    if work_type:
+        permit_query += " AND p.work_type = :work_type"
+        params['work_type'] = work_type
+    if permit_type:
+        permit_query += " AND p.permit_type = :permit_type"
+        params['permit_type'] = permit_type
+    if permit_status:
+        permit_query += " AND p.permit_status = :permit_status"
+        params['permit_status'] = permit_status
+    if bldg_type:
+        permit_query += " AND p.bldg_type = :bldg_type"
+        params['bldg_type'] = bldg_type
+    if residential:
+        permit_query += " AND p.residential = :residential"
+        params['residential'] = residential
+
+    owner_query = "SELECT COUNT(*) FROM owner_contacts WHERE phone IS NOT NULL AND phone != ''"
+    if search:
+        owner_query += " AND (owner_name ILIKE :search OR phone ILIKE :search)"
+
+    if source in ('all', 'permit', 'owner'):
+        if source == 'all':
+            query = f"SELECT ({permit_query}) + ({owner_query})"
+        elif source == 'permit':
+            query = permit_query
+        else:
+            query = owner_query
+        engine = get_leads_engine()
+        with engine.connect() as conn:
+            total += conn.execute(text(query), params).scalar() or 0
+
+    if source in ('all', 'manual'):
+        from database import get_session, ManualContact
+        session = get_session()
+        try:
+            manual_query = session.query(ManualContact)
+            if search:
+                search_term = f"%{search}%"
+                manual_query = manual_query.filter(
+                    (ManualContact.name.ilike(search_term)) |
+                    (ManualContact.phone_number.ilike(search_term)) |
+                    (ManualContact.company.ilike(search_term))
+                )
+            if role:
+                manual_query = manual_query.filter(ManualContact.role.ilike(f"%{role}%"))
+            total += manual_query.count()
+        finally:
+            session.close()
+
+    return total
+
+
 def get_total_contact_count(mobile_only: bool = True, source: str = 'all', borough: str = None, role: str = None):
     """Get total count of contacts for pagination"""
     engine = get_leads_engine()
-    total = 0
-    
+
+    permit_query = """
+        SELECT COUNT(DISTINCT c.phone)
+        FROM contacts c
+        LEFT JOIN permit_contacts pc ON c.id = pc.contact_id
+        LEFT JOIN permits p ON pc.permit_id = p.id
+        WHERE c.phone IS NOT NULL AND c.phone != ''
+    """
+    params = {}
+    if mobile_only:
+        permit_query += " AND c.is_mobile = true"
+    if borough:
+        permit_query += " AND p.borough = :borough"
+        params['borough'] = borough
+    if role:
+        permit_query += " AND c.role = :role"
+        params['role'] = role
+
+    owner_query = "SELECT COUNT(*) FROM owner_contacts WHERE phone IS NOT NULL AND phone != ''"
+
+    # Both aggregates in one statement when counting all sources, so the
+    # endpoint pays a single round-trip to the leads DB
+    if source == 'all':
+        query = f"SELECT ({permit_query}) + ({owner_query})"
+    elif source == 'permit':
+        query = permit_query
+    elif source == 'owner':
+        query = owner_query
+    else:
+        return 0
+
     with engine.connect() as conn:
-        if source in ['all', 'permit']:
-            query = """
-                SELECT COUNT(DISTINCT c.phone) 
-                FROM contacts c
-                LEFT JOIN permit_contacts pc ON c.id = pc.contact_id
-                LEFT JOIN permits p ON pc.permit_id = p.id
-                WHERE c.phone IS NOT NULL AND c.phone != ''
-            """
-            params = {}
-            if mobile_only:
-                query += " AND c.is_mobile = true"
-            if borough:
-                query += " AND p.borough = :borough"
-                params['borough'] = borough
-            if role:
-                query += " AND c.role = :role"
-                params['role'] = role
-            total += conn.execute(text(query), params).scalar()
-        
-        if source in ['all', 'owner']:
-            query = "SELECT COUNT(*) FROM owner_contacts WHERE phone IS NOT NULL AND phone != ''"
-            total += conn.execute(text(query)).scalar()
-    
-    return total
+        return conn.execute(text(query), params).scalar() or 0
 
 
+@lru_cache(maxsize=10000)
 def normalize_phone(phone):
     """Normalize phone number to +1XXXXXXXXXX format"""
     if not phone:
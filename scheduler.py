@@ -239,7 +239,7 @@ class MessageScheduler:
                 contacts_map = {c.get('phone_normalized') or c.get('phone'): c for c in contacts_list}
             
             # Send ONLY to the specified phone numbers
-            for phone in phone_numbers:
+            for i, phone in enumerate(phone_numbers, start=1):
                 # Fill template variables if needed
                 message_body = bulk_msg.body
                 if has_variables:
@@ -253,7 +253,10 @@ class MessageScheduler:
                     bulk_msg.sent_count += 1
                 else:
                     bulk_msg.failed_count += 1
-                session.commit()
+                # Persist progress every few sends instead of every send -
+                # one commit round-trip per recipient dominated the loop
+                if i % 10 == 0:
+                    session.commit()
             
             # Handle recurring messages
             if bulk_msg.is_recurring:
@@ -1,8 +1,12 @@
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 import logging
 import phonenumbers
+from requests.adapters import HTTPAdapter
+from sqlalchemy import update
 from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
 from twilio.base.exceptions import TwilioRestException
 
 from config import Config
@@ -11,6 +15,19 @@ from leads_service import get_contact_by_phone, get_contacts_by_phones
 
 logger = logging.getLogger(__name__)
 
+# Bounded fan-out for bulk sends - each Twilio API call is ~200-400ms of
+# HTTPS round-trip, so a small pool turns N sequential calls into ~N/8
+BULK_SEND_WORKERS = 8
+
+# Twilio callback status -> internal MessageStatus
+_STATUS_CALLBACK_MAP = {
+    'queued': MessageStatus.PENDING.value,
+    'sent': MessageStatus.SENT.value,
+    'delivered': MessageStatus.DELIVERED.value,
+    'failed': MessageStatus.FAILED.value,
+    'undelivered': MessageStatus.FAILED.value
+}
+
 
 def normalize_phone(phone: str, default_region: str = "US") -> str:
     """
@@ -35,7 +52,19 @@ class TwilioService:
     """Service layer for Twilio SMS operations"""
     
     def __init__(self):
-        self.client = Client(Config.TWILIO_ACCOUNT_SID, Config.TWILIO_AUTH_TOKEN)
+        # Size the SDK's keep-alive session past the default 10-connection
+        # adapter so parallel bulk sends reuse TLS connections instead of
+        # handshaking per call (TwilioHttpClient takes no session kwarg, so
+        # mount onto the one it builds)
+        http_client = TwilioHttpClient()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        http_client.session.mount('https://', adapter)
+        http_client.session.mount('http://', adapter)
+        self.client = Client(
+            Config.TWILIO_ACCOUNT_SID,
+            Config.TWILIO_AUTH_TOKEN,
+            http_client=http_client
+        )
         self.from_number = Config.TWILIO_PHONE_NUMBER
         # Only use status callback if we have a real URL (not localhost)
         webhook_url = Config.WEBHOOK_BASE_URL
@@ -104,41 +133,62 @@ class TwilioService:
             return {'success': False, 'error': str(e), 'message': result}
     
     def send_bulk_sms(self, phone_numbers: list, body: str) -> dict:
-        """Send SMS to multiple recipients"""
+        """Send SMS to multiple recipients in parallel over the shared client"""
         results = {'sent': 0, 'failed': 0, 'messages': []}
-        
-        for phone in phone_numbers:
-            result = self.send_sms(phone, body)
-            if result['success']:
-                results['sent'] += 1
-            else:
-                results['failed'] += 1
-            results['messages'].append(result)
-        
+
+        if not phone_numbers:
+            return results
+
+        # The twilio Client is thread-safe and keep-alives connections via
+        # urllib3, so workers share one TLS session instead of reconnecting
+        with ThreadPoolExecutor(max_workers=min(BULK_SEND_WORKERS, len(phone_numbers))) as executor:
+            futures = [executor.submit(self.send_sms, phone, body) for phone in phone_numbers]
+            for future in as_completed(futures):
+                result = future.result()
+                if result['success']:
+                    results['sent'] += 1
+                else:
+                    results['failed'] += 1
+                results['messages'].append(result)
+
         return results
     
     def get_message_history(self, phone_number: str = None, limit: int = 100) -> list:
         """Get message history, optionally filtered by phone number"""
+        return list(self.iter_message_history(phone_number, limit))
+
+    def iter_message_history(self, phone_number: str = None, limit: int = 100, batch_size: int = 200):
+        """
+        Stream message history dicts without materializing the full list.
+        Rows are fetched with yield_per and contacts resolved one batch at
+        a time, so peak memory stays O(batch_size) for any limit.
+        """
         session = get_session()
-        query = session.query(Message).order_by(Message.created_at.desc())
-        
-        if phone_number:
-            query = query.filter(Message.phone_number == phone_number)
-        
-        messages = query.limit(limit).all()
-        
-        # Get contact info for all phone numbers in one query
+        try:
+            query = session.query(Message).order_by(Message.created_at.desc())
+
+            if phone_number:
+                query = query.filter(Message.phone_number == phone_number)
+
+            batch = []
+            for m in query.limit(limit).yield_per(batch_size):
+                batch.append(m)
+                if len(batch) >= batch_size:
+                    yield from self._messages_to_dicts(batch)
+                    batch = []
+            if batch:
+                yield from self._messages_to_dicts(batch)
+        finally:
+            session.close()
+
+    def _messages_to_dicts(self, messages):
+        """Resolve contacts for a batch of messages in one leads query"""
         phones = list(set(m.phone_number for m in messages))
         contacts_list = get_contacts_by_phones(phones)
         contacts_map = {c['phone_normalized']: c for c in contacts_list}
-        
-        result = []
+
         for m in messages:
-            contact = contacts_map.get(m.phone_number)
-            result.append(m.to_dict(contact=contact))
-        
-        session.close()
-        return result
+            yield m.to_dict(contact=contacts_map.get(m.phone_number))
     
     def get_conversations(self) -> list:
         """Get list of unique conversations grouped by phone number"""
@@ -161,15 +211,21 @@ class TwilioService:
         phones = [msg.phone_number for msg in conversations]
         contacts_list = get_contacts_by_phones(phones)
         contacts_map = {c['phone_normalized']: c for c in contacts_list}
-        
+
+        # Per-phone message counts in one grouped IN query instead of one
+        # COUNT round-trip per conversation
+        counts = dict(session.query(
+            Message.phone_number, func.count(Message.id)
+        ).filter(
+            Message.phone_number.in_(phones)
+        ).group_by(Message.phone_number).all()) if phones else {}
+
         result = []
         for msg in conversations:
-            msg_count = session.query(Message).filter(
-                Message.phone_number == msg.phone_number
-            ).count()
-            
+            msg_count = counts.get(msg.phone_number, 0)
+
             contact = contacts_map.get(msg.phone_number)
-            
+
             conv_data = {
                 'phone_number': msg.phone_number,
                 'last_message': msg.to_dict(contact=contact),
@@ -226,26 +282,19 @@ class TwilioService:
     
     def update_message_status(self, twilio_sid: str, status: str) -> bool:
         """Update message status from Twilio callback"""
+        # twilio_sid is unique-indexed, so this is one indexed row write -
+        # no SELECT round-trip before the UPDATE
         session = get_session()
-        message = session.query(Message).filter(
-            Message.twilio_sid == twilio_sid
-        ).first()
-        
-        if message:
-            status_map = {
-                'queued': MessageStatus.PENDING.value,
-                'sent': MessageStatus.SENT.value,
-                'delivered': MessageStatus.DELIVERED.value,
-                'failed': MessageStatus.FAILED.value,
-                'undelivered': MessageStatus.FAILED.value
-            }
-            message.status = status_map.get(status, status)
+        try:
+            result = session.execute(
+                update(Message).where(Message.twilio_sid == twilio_sid).values(
+                    status=_STATUS_CALLBACK_MAP.get(status, status)
+                )
+            )
             session.commit()
+            return result.rowcount > 0
+        finally:
             session.close()
-            return True
-        
-        session.close()
-        return False
 
 
 # Singleton instance